@@ -13,13 +13,9 @@ import pandas as pd
 import numpy as np
 import streamlit as st
 import plotly.express as px
-from tools import passcheck, sidemenu
-import dropbox
-import dropbox.files
-from io import BytesIO
+from tools import passcheck, sidemenu, datastore, charts
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
-import uuid 
 
 # page configuration
 st.set_page_config(
@@ -37,37 +33,16 @@ with open("styles.css") as stl:
 sidemenu.insert_smenu()
 
 if passcheck.check_password():
-# Defining auth secrets (when app is already deployed)
-    dbtoken  = st.secrets["dbtoken"]
-    dbkey    = st.secrets["dbkey"]
-    dbsecret = st.secrets["dbsecret"]
-
-
-    atoken = passcheck.retrieve_DBtoken(dbkey, dbsecret, dbtoken)
 
     #####################################################################################################################
     #                                                        LOADING DATA                                               #
     #####################################################################################################################
-        # Accessing Dropbox
-    dbx = dropbox.Dropbox(atoken)
-
-    # loading function
-    @st.cache_data
-    def load_DBfile(file, format, sheet=None):
+    # Every tab reads the current snapshot of the shared data store (refreshed in the background)
+    # each time it runs, so reruns of a single tab also pick up new data generations.
 
-        # accessing dropbox files
-        __, res = dbx.files_download(f"/{file}")
-        data = res.content
-
-    # reading data frames
-        with BytesIO(data) as file:
-            if format == 'excel':
-                df = pd.read_excel(file, sheet_name = sheet)
-            if format == 'csv':
-                df = pd.read_csv(file)
-        return df
-    # loading barriers csv
-    justice_score_summary = load_DBfile("barriers.csv", format = 'csv')
+    # figures only depend on their inputs and the data generation, so every session shares them
+    def cached_chart(snapshot, key, build):
+        return charts.cached_figure(("Justice_Gap",) + key, snapshot.version, build)
 
 
     st.markdown(
@@ -83,8 +58,22 @@ if passcheck.check_password():
         unsafe_allow_html = True
     )
 
+    # optional mode: every country is shipped in a single figure and picked from the chart's own menu,
+    # so browsing countries happens in the browser without rerunning the page
+    switch_in_browser = st.toggle(
+        "Switch countries inside the charts",
+        help = "Loads all countries at once. Available for the barrier distribution and the sociodemographic effects."
+    )
+
     barrierstab, sociotab = st.tabs(["Distribution of Barriers", "Sociodemographic Effects"])
-    with barrierstab:
+
+    # every tab is a fragment: its widgets only rerun the tab they belong to
+    @st.fragment
+    def barriers_tab():
+        snapshot = datastore.get_snapshot()
+
+        # loading barriers csv
+        justice_score_summary = snapshot.get("barriers")
 
 
         # User selects EU or specific countries
@@ -100,45 +89,47 @@ if passcheck.check_password():
 
         filtered_data = justice_score_summary[justice_score_summary['country_name_ltn'].isin(country_selection)]
 
-        # Create a long-format DataFrame for easier plotting
-        plot_data = filtered_data.melt(id_vars=["country_name_ltn"], 
-                                    value_vars=['pct_in_gap', 'pct_not_in_gap'],
-                                    var_name="Justice Gap Status",
-                                    value_name="Percentage")
-
-        fig_gap = px.bar(
-            plot_data,
-            x="Percentage",
-            y="country_name_ltn",
-            color="Justice Gap Status",
-            orientation="h",
-            barmode="stack",
-            title="Justice Gap Across Selected Countries",
-            text=plot_data["Percentage"].apply(lambda x: f"{x:.2f}%")
-        )
+        def build_justice_gap():
+            # Create a long-format DataFrame for easier plotting
+            plot_data = filtered_data.melt(id_vars=["country_name_ltn"], 
+                                        value_vars=['pct_in_gap', 'pct_not_in_gap'],
+                                        var_name="Justice Gap Status",
+                                        value_name="Percentage")
+
+            fig_gap = px.bar(
+                plot_data,
+                x="Percentage",
+                y="country_name_ltn",
+                color="Justice Gap Status",
+                orientation="h",
+                barmode="stack",
+                title="Justice Gap Across Selected Countries",
+                text=plot_data["Percentage"].apply(lambda x: f"{x:.2f}%")
+            )
 
-        fig_gap.update_traces(
-            hovertemplate="In <b>%{y}</b>, <b>%{x:.2f}%</b> of respondents who experienced a nontrivial <br>legal problem in the past two years were " +
-                        "<b>%{customdata}</b>.<extra></extra>",
-            customdata=plot_data["Justice Gap Status"].replace({"pct_in_gap": "in the justice gap", "pct_not_in_gap": "not in the justice gap"})
-        )
+            fig_gap.update_traces(
+                hovertemplate="In <b>%{y}</b>, <b>%{x:.2f}%</b> of respondents who experienced a nontrivial <br>legal problem in the past two years were " +
+                            "<b>%{customdata}</b>.<extra></extra>",
+                customdata=plot_data["Justice Gap Status"].replace({"pct_in_gap": "in the justice gap", "pct_not_in_gap": "not in the justice gap"})
+            )
 
-        # Update layout to format text, remove legend, and hide y-axis label
-        fig_gap.update_traces(
-            textposition="inside",  
-            insidetextanchor="middle",  
-            textfont=dict(size=18, color="white")  
-        )
+            # Update layout to format text, remove legend, and hide y-axis label
+            fig_gap.update_traces(
+                textposition="inside",  
+                insidetextanchor="middle",  
+                textfont=dict(size=18, color="white")  
+            )
 
-        fig_gap.update_layout(
-            showlegend=False,  
-            yaxis_title="",  
-            xaxis=dict(title="Percentage (%)"),  
-            margin=dict(l=100, r=20, t=50, b=50),
-            plot_bgcolor="white"
-        )
+            fig_gap.update_layout(
+                showlegend=False,  
+                yaxis_title="",  
+                xaxis=dict(title="Percentage (%)"),  
+                margin=dict(l=100, r=20, t=50, b=50),
+                plot_bgcolor="white"
+            )
+            return fig_gap
 
-        st.plotly_chart(fig_gap)
+        st.plotly_chart(cached_chart(snapshot, ('justice_gap', tuple(country_selection)), build_justice_gap))
 
 
         demographics = st.selectbox(
@@ -152,20 +143,13 @@ if passcheck.check_password():
                 )
 
             if demo == "Gender":
-                data = load_DBfile("justice_gap_gend.csv", format = 'csv')
-                # data = pd.read_csv('.streamlit/inputs/justice_gap_gend.csv')
-                dem_groups = ["Male", "Female"]
+                data = snapshot.get("barriers_gender")
 
             if demo == "Income":
-                data = load_DBfile('justice_gap_es.csv', format = 'csv')
-                # data = pd.read_csv('.streamlit/inputs/justice_gap_es.csv')
-                dem_groups = [0,1]
+                data = snapshot.get("barriers_income")
 
             if demo == "Both":
-                data = load_DBfile('dem_breakdowns_justice_gap.csv', format = 'csv')
-                # data = pd.read_csv('.streamlit/inputs/dem_breakdowns_justice_gap.csv')
-                data['combined_group'] = data['gender'] + ', ' + data['fintight'].astype("string")
-                dem_groups = ['Female, 0', 'Female, 1', 'Male, 0', 'Male, 1']
+                data = snapshot.get("barriers_both")
 
 
 
@@ -182,301 +166,341 @@ if passcheck.check_password():
                 if demo == "Gender":
                     subset['group_label'] = subset['gender']
                 elif demo == "Income":
-                    subset['group_label'] = subset['fintight'].map({1: "Low ES", 0: "High ES"})
+                    subset['group_label'] = subset['fintight'].map(datastore.INCOME_LABELS)
                 elif demo == "Both":
-                    subset['group_label'] = subset['gender'] + " - " + subset['fintight'].map({1: "Low ES", 0: "High ES"})
+                    subset['group_label'] = subset['combined_group']
                 
 
-            barrier_melted = subset.melt(id_vars=['group_label'],
-                                  value_vars=['pct_0_barriers', 'pct_1_barrier', 'pct_2_barrier', 'pct_3_barriers', 'pct_4_barriers'],
-                                  var_name='Barrier Type',
-                                  value_name='Percentage')
-            barrier_melted['Barrier Type'] = barrier_melted['Barrier Type'].replace({
-                'pct_0_barriers': 'No Barriers',
-                'pct_1_barrier': '1 Barrier',
-                'pct_2_barrier': '2 Barriers',
-                'pct_3_barriers': '3 Barriers',
-                'pct_4_barriers': '4 Barriers'
-            })
+            def build_barrier_distribution():
+                barrier_melted = subset.melt(id_vars=['group_label'],
+                                      value_vars=['pct_0_barriers', 'pct_1_barrier', 'pct_2_barrier', 'pct_3_barriers', 'pct_4_barriers'],
+                                      var_name='Barrier Type',
+                                      value_name='Percentage')
+                barrier_melted['Barrier Type'] = barrier_melted['Barrier Type'].replace({
+                    'pct_0_barriers': 'No Barriers',
+                    'pct_1_barrier': '1 Barrier',
+                    'pct_2_barrier': '2 Barriers',
+                    'pct_3_barriers': '3 Barriers',
+                    'pct_4_barriers': '4 Barriers'
+                })
 
-            fig_barrier = px.bar(
-                barrier_melted,
-                x='Barrier Type',
-                y='Percentage',
-                color='group_label',
-                barmode='stack',
-                title=f"Stacked Barrier Distribution by {demo} in {selected_country}",
-                labels={'Percentage': 'Percentage (%)', 'Barrier Type': 'Number of Barriers Faced', 'group_label': 'Demographic Group'}
-            )
-            fig_barrier.update_traces(hovertemplate="<b>%{y:.2f}%</b> experienced %{x}.")
-            st.plotly_chart(fig_barrier, key=f"bar_chart_{selected_country}_{uuid.uuid4()}")
+                fig_barrier = px.bar(
+                    barrier_melted,
+                    x='Barrier Type',
+                    y='Percentage',
+                    color='group_label',
+                    barmode='stack',
+                    title=f"Stacked Barrier Distribution by {demo} in {selected_country}",
+                    labels={'Percentage': 'Percentage (%)', 'Barrier Type': 'Number of Barriers Faced', 'group_label': 'Demographic Group'}
+                )
+                fig_barrier.update_traces(hovertemplate="<b>%{y:.2f}%</b> experienced %{x}.")
+                return fig_barrier
+
+            st.plotly_chart(cached_chart(snapshot, ('barrier_distribution', demo, selected_country), build_barrier_distribution), key=charts.chart_key("bar_chart", demo, selected_country, version = snapshot.version))
 
             group_labels = subset['group_label'].unique()
 
 
             # pie charts
-            num_groups = len(group_labels)
-            rows, cols = (1, 2) if num_groups == 2 else (2, 2)
+            def build_barrier_types():
+                num_groups = len(group_labels)
+                rows, cols = (1, 2) if num_groups == 2 else (2, 2)
             
-            fig_pie = make_subplots(rows=rows, subplot_titles=subset['group_label'].values,cols=cols, specs=[[{"type": "domain"} for _ in range(cols)] for _ in range(rows)])
+                fig_pie = make_subplots(rows=rows, subplot_titles=subset['group_label'].values,cols=cols, specs=[[{"type": "domain"} for _ in range(cols)] for _ in range(rows)])
             
-            row_idx, col_idx = 1, 1
-            for group in group_labels:
-                group_data = subset[subset['group_label'] == group]
+                row_idx, col_idx = 1, 1
+                for group in group_labels:
+                    group_data = subset[subset['group_label'] == group]
                 
-                share_of_barriers = group_data.melt(id_vars=['group_label'],
-                                                    value_vars=['pct_solution_barrier_barrier_1', 'pct_solution_barrier_barrier_2', 'pct_solution_barrier_barrier_3',
-                                                                'pct_info_barrier_barrier_1', 'pct_info_barrier_barrier_2', 'pct_info_barrier_barrier_3',
-                                                                'pct_dcf_barrier_barrier_1', 'pct_dcf_barrier_barrier_2', 'pct_dcf_barrier_barrier_3',
-                                                                'pct_representation_barrier_barrier_1', 'pct_representation_barrier_barrier_2', 'pct_representation_barrier_barrier_3'],
-                                                    var_name='Barrier Type',
-                                                    value_name='Percentage')
+                    share_of_barriers = group_data.melt(id_vars=['group_label'],
+                                                        value_vars=['pct_solution_barrier_barrier_1', 'pct_solution_barrier_barrier_2', 'pct_solution_barrier_barrier_3',
+                                                                    'pct_info_barrier_barrier_1', 'pct_info_barrier_barrier_2', 'pct_info_barrier_barrier_3',
+                                                                    'pct_dcf_barrier_barrier_1', 'pct_dcf_barrier_barrier_2', 'pct_dcf_barrier_barrier_3',
+                                                                    'pct_representation_barrier_barrier_1', 'pct_representation_barrier_barrier_2', 'pct_representation_barrier_barrier_3'],
+                                                        var_name='Barrier Type',
+                                                        value_name='Percentage')
                 
-                share_of_barriers['Barrier Type'] = share_of_barriers['Barrier Type'].replace({
-                    'pct_solution_barrier_barrier_1': 'Solution', 'pct_solution_barrier_barrier_2': 'Solution', 'pct_solution_barrier_barrier_3': 'Solution',
-                    'pct_info_barrier_barrier_1': 'Information', 'pct_info_barrier_barrier_2': 'Information', 'pct_info_barrier_barrier_3': 'Information',
-                    'pct_dcf_barrier_barrier_1': 'Delays, Fairness, Cost', 'pct_dcf_barrier_barrier_2': 'Delays, Fairness, Cost', 'pct_dcf_barrier_barrier_3': 'Delays, Fairness, Cost',
-                    'pct_representation_barrier_barrier_1': 'Representation', 'pct_representation_barrier_barrier_2': 'Representation', 'pct_representation_barrier_barrier_3': 'Representation'
-                })
+                    share_of_barriers['Barrier Type'] = share_of_barriers['Barrier Type'].replace({
+                        'pct_solution_barrier_barrier_1': 'Solution', 'pct_solution_barrier_barrier_2': 'Solution', 'pct_solution_barrier_barrier_3': 'Solution',
+                        'pct_info_barrier_barrier_1': 'Information', 'pct_info_barrier_barrier_2': 'Information', 'pct_info_barrier_barrier_3': 'Information',
+                        'pct_dcf_barrier_barrier_1': 'Delays, Fairness, Cost', 'pct_dcf_barrier_barrier_2': 'Delays, Fairness, Cost', 'pct_dcf_barrier_barrier_3': 'Delays, Fairness, Cost',
+                        'pct_representation_barrier_barrier_1': 'Representation', 'pct_representation_barrier_barrier_2': 'Representation', 'pct_representation_barrier_barrier_3': 'Representation'
+                    })
                 
-                fig_pie.add_trace(
-                    go.Pie(
-                        labels=share_of_barriers['Barrier Type'],
-                        values=share_of_barriers['Percentage'],
-                        name=group,
-                        hole=0.4
-                    ),
-                    row=row_idx, col=col_idx
-                )
+                    fig_pie.add_trace(
+                        go.Pie(
+                            labels=share_of_barriers['Barrier Type'],
+                            values=share_of_barriers['Percentage'],
+                            name=group,
+                            hole=0.4
+                        ),
+                        row=row_idx, col=col_idx
+                    )
                 
-                col_idx += 1
-                if col_idx > cols:
-                    col_idx = 1
-                    row_idx += 1
+                    col_idx += 1
+                    if col_idx > cols:
+                        col_idx = 1
+                        row_idx += 1
             
-            fig_pie.update_layout(title_text=f"Barrier Types by {demo} in {selected_country}", showlegend=True)
-            st.plotly_chart(fig_pie, key=f"pie_chart_{selected_country}_{uuid.uuid4()}")
+                fig_pie.update_layout(title_text=f"Barrier Types by {demo} in {selected_country}", showlegend=True)
+                return fig_pie
+
+            st.plotly_chart(cached_chart(snapshot, ('barrier_types', demo, selected_country), build_barrier_types), key=charts.chart_key("pie_chart", demo, selected_country, version = snapshot.version))
 
                                 
         if demographics == "Total Sample":
-            selected_country = st.selectbox(
-                "Select a country to analyze barrier distribution:",
-                country_selection
-            )
-            country_data = filtered_data[
-                filtered_data["country_name_ltn"] == selected_country
-                ]
-            
-            barrier_data = pd.DataFrame({
-                "Barrier Type": ["No Barriers","1 Barrier", "2 Barriers", "3 Barriers", "4 Barriers"],
-                "Percentage": [
-                    country_data["pct_0_barriers"].values[0],
-                    country_data["pct_1_barrier"].values[0], 
-                    country_data["pct_2_barrier"].values[0], 
-                    country_data["pct_3_barriers"].values[0], 
-                    country_data["pct_4_barriers"].values[0]
-                ]
-            })
+            def build_barrier_distribution(selected_country):
+                country_data = filtered_data[
+                    filtered_data["country_name_ltn"] == selected_country
+                    ]
+
+                barrier_data = pd.DataFrame({
+                    "Barrier Type": ["No Barriers","1 Barrier", "2 Barriers", "3 Barriers", "4 Barriers"],
+                    "Percentage": [
+                        country_data["pct_0_barriers"].values[0],
+                        country_data["pct_1_barrier"].values[0], 
+                        country_data["pct_2_barrier"].values[0], 
+                        country_data["pct_3_barriers"].values[0], 
+                        country_data["pct_4_barriers"].values[0]
+                    ]
+                })
 
 
-            fig_b  = px.bar(
-                barrier_data,
-                x="Barrier Type",
-                y="Percentage",
-                title=f"Barrier Distribution in {selected_country} ",
-                labels={"Percentage": "Percentage (%)", "Barrier Type": "Number of Barriers Faced"},
-                color="Barrier Type"  
-            )
-            fig_b.update_traces(
-                hovertemplate = "<b>%{y:.2f}%</b> of respondents experienced %{x}. "
-            )
-            fig_b.update_layout(
-                showlegend = False,
-                yaxis = dict(range = [0,100])
+                fig_b  = px.bar(
+                    barrier_data,
+                    x="Barrier Type",
+                    y="Percentage",
+                    title=f"Barrier Distribution in {selected_country} ",
+                    labels={"Percentage": "Percentage (%)", "Barrier Type": "Number of Barriers Faced"},
+                    color="Barrier Type"  
+                )
+                fig_b.update_traces(
+                    hovertemplate = "<b>%{y:.2f}%</b> of respondents experienced %{x}. "
+                )
+                fig_b.update_layout(
+                    showlegend = False,
+                    yaxis = dict(range = [0,100])
+                )
+                return fig_b
+
+            def build_barrier_types(selected_country):
+                country_data = filtered_data[
+                    filtered_data["country_name_ltn"] == selected_country
+                    ]
+
+                share_of_barriers = pd.DataFrame({
+                    "Number of Barriers Faced" : [1, 2, 3],
+                    "Solution" : [
+                        country_data['pct_solution_barrier_barrier_1'].values[0],
+                        country_data['pct_solution_barrier_barrier_2'].values[0],
+                        country_data['pct_solution_barrier_barrier_3'].values[0]
+                    ],
+                    "Information" : [
+                        country_data['pct_info_barrier_barrier_1'].values[0],
+                        country_data['pct_info_barrier_barrier_2'].values[0],
+                        country_data['pct_info_barrier_barrier_3'].values[0]
+                    ],
+                    "Delays, Fairness, Cost" : [
+                        country_data['pct_dcf_barrier_barrier_1'].values[0],
+                        country_data['pct_dcf_barrier_barrier_2'].values[0],
+                        country_data['pct_dcf_barrier_barrier_3'].values[0]
+                    ],
+                    "Representation" : [
+                        country_data['pct_representation_barrier_barrier_1'].values[0],
+                        country_data['pct_representation_barrier_barrier_2'].values[0],
+                        country_data['pct_representation_barrier_barrier_3'].values[0]
+                    ]
+                })
+
+                # Barrier Types for Labels
+                barrier_labels = ["Solution Barrier", "Delays, Cost or Fairness Barrier", "Information Barrier", "Representation Barrier"]
+                barrier_count_labels = ["Experienced 1 Barrier", "Experienced 2 Barriers", "Experienced 3 Barriers"]
+
+                # Create subplot layout with 1 row and 3 columns
+                fig = make_subplots(
+                    rows=1, cols=3, 
+                    specs=[[{"type": "domain"}, {"type": "domain"}, {"type": "domain"}]]  # Each subplot is a pie chart
+                )
+                custom_colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728"]  # Blue, Orange, Green, Red
+
+
+                # Add Pie Charts for Each Barrier Count
+                for i, row in share_of_barriers.iterrows():
+                    fig.add_trace(
+                        go.Pie(
+                            labels=barrier_labels,
+                            values=row[1:],  
+                            hole=0.4,  
+                            marker=dict(colors=custom_colors),  
+                            hovertemplate="<b>%{label}</b>: <b>%{value:.2f}%</b><extra></extra>"
+
+                        ),
+                        row=1, col=i+1  
+                    )
+
+                for i, label in enumerate(barrier_count_labels):
+                    fig.add_annotation(
+                        text=f"<b>{label}</b>",  
+                        x=i / 2,  
+                        y=-0.1,  
+                        showarrow=False,
+                        font=dict(size=14)
+                    )
+
+                # Format layout
+                fig.update_layout(
+                    title_text=f"Distribution of Barrier Types by Barrier Count in {selected_country}",
+                    showlegend=True,
+                    legend=dict(
+                        orientation="h",  
+                        yanchor="bottom",  
+                        y=1.05,  
+                        xanchor="center",  
+                        x=0.5  
+                    )  
+                )
+                return fig
+
+            if switch_in_browser and country_selection:
+                countries = tuple(country_selection)
+                st.plotly_chart(cached_chart(
+                    snapshot,
+                    ('barrier_distribution', 'Total Sample', countries),
+                    lambda: charts.country_dropdown({country: build_barrier_distribution(country) for country in countries})
+                ))
+                st.plotly_chart(cached_chart(
+                    snapshot,
+                    ('barrier_types', 'Total Sample', countries),
+                    lambda: charts.country_dropdown({country: build_barrier_types(country) for country in countries})
+                ))
+            else:
+                selected_country = st.selectbox(
+                    "Select a country to analyze barrier distribution:",
+                    country_selection
+                )
+                st.plotly_chart(cached_chart(
+                    snapshot,
+                    ('barrier_distribution', 'Total Sample', selected_country),
+                    lambda: build_barrier_distribution(selected_country)
+                ))
+                st.plotly_chart(cached_chart(
+                    snapshot,
+                    ('barrier_types', 'Total Sample', selected_country),
+                    lambda: build_barrier_types(selected_country)
+                ))
+
+
+
+    @st.fragment
+    def socio_tab():
+        snapshot      = datastore.get_snapshot()
+        logistic_data = snapshot.get("logit_reg_gap")
+
+        if not switch_in_browser:
+            eu_or_country_socio = st.selectbox(
+                "Would you like to focus on a specific country or the whole EU? ",
+                ["Country", "EU"],
+                index = 1
             )
 
-            st.plotly_chart(fig_b)
+            if eu_or_country_socio == "Country":
+            # Step 1: Select Country
+                selected_country_socio = st.selectbox(
+                    "Select a country:",
+                    logistic_data["country_name_ltn"].unique(),
+                    index=0  # Default to EU
+                )
+            if eu_or_country_socio == "EU":
+                selected_country_socio = "EU"
 
+        def build_forest_plot(selected_country_socio):
+            # Step 2: Filter Data for Selected Country
+            country_data = logistic_data[logistic_data["country_name_ltn"] == selected_country_socio].iloc[0]
 
-            share_of_barriers = pd.DataFrame({
-                "Number of Barriers Faced" : [1, 2, 3],
-                "Solution" : [
-                    country_data['pct_solution_barrier_barrier_1'].values[0],
-                    country_data['pct_solution_barrier_barrier_2'].values[0],
-                    country_data['pct_solution_barrier_barrier_3'].values[0]
+            # Step 3: Reshape Data for Plotly
+            effect_data = pd.DataFrame({
+                "Characteristic": ["Female", "Urban", "No High School Diploma", "Younger than 30", "Low Economic Status"],
+                "AME": [
+                    country_data["female"],
+                    country_data["urban"],
+                    country_data["no_hs"],
+                    country_data["less_than_30"],
+                    country_data["low_es"]
                 ],
-                "Information" : [
-                    country_data['pct_info_barrier_barrier_1'].values[0],
-                    country_data['pct_info_barrier_barrier_2'].values[0],
-                    country_data['pct_info_barrier_barrier_3'].values[0]
+                "Lower Bound": [
+                    country_data["female_lower"],
+                    country_data["urban_lower"],
+                    country_data["no_hs_lower"],
+                    country_data["less_than_30_lower"],
+                    country_data["low_es_lower"]
                 ],
-                "Delays, Fairness, Cost" : [
-                    country_data['pct_dcf_barrier_barrier_1'].values[0],
-                    country_data['pct_dcf_barrier_barrier_2'].values[0],
-                    country_data['pct_dcf_barrier_barrier_3'].values[0]
-                ],
-                "Representation" : [
-                    country_data['pct_representation_barrier_barrier_1'].values[0],
-                    country_data['pct_representation_barrier_barrier_2'].values[0],
-                    country_data['pct_representation_barrier_barrier_3'].values[0]
+                "Upper Bound": [
+                    country_data["female_upper"],
+                    country_data["urban_upper"],
+                    country_data["no_hs_upper"],
+                    country_data["less_than_30_upper"],
+                    country_data["low_es_upper"]
                 ]
             })
 
-            # Barrier Types for Labels
-            barrier_labels = ["Solution Barrier", "Delays, Cost or Fairness Barrier", "Information Barrier", "Representation Barrier"]
-            barrier_count_labels = ["Experienced 1 Barrier", "Experienced 2 Barriers", "Experienced 3 Barriers"]
-
-            # Create subplot layout with 1 row and 3 columns
-            fig = make_subplots(
-                rows=1, cols=3, 
-                specs=[[{"type": "domain"}, {"type": "domain"}, {"type": "domain"}]]  # Each subplot is a pie chart
+            # Step 4: Create the Forest Plot (Horizontal Error Bar Chart)
+            fig = go.Figure()
+
+            # Add error bars for confidence intervals
+            fig.add_trace(go.Scatter(
+                x=effect_data["AME"],
+                y=effect_data["Characteristic"],
+                mode="markers",
+                marker=dict(color="green", size=10),
+                error_x=dict(
+                    type="data",
+                    symmetric=False,
+                    array=effect_data["Upper Bound"] - effect_data["AME"],  # Upper CI
+                    arrayminus=effect_data["AME"] - effect_data["Lower Bound"]  # Lower CI
+                ),
+                hovertemplate="<b>%{y}: %{x:.2f} p.p.</b><br>" +  # Bold first line with effect value
+                      "On average, this attribute changes the probability of being in the justice gap by <b>%{x:.2f}%</b>.<br>" +  
+                      "We are 95% confident that the effect is between <b>%{customdata[0]:.2f}</b> and <b>%{customdata[1]:.2f}</b> percentage points.<extra></extra>",
+                customdata=effect_data[["Lower Bound", "Upper Bound"]].values  # Pass lower/upper bound for hover text
+
+            ))
+
+            # Add vertical line at 0% (Neutral Effect)
+            fig.add_shape(
+                type="line",
+                x0=0, x1=0,
+                y0=-0.5, y1=len(effect_data) - 0.5,
+                line=dict(color="pink", width=1.5)
             )
-            custom_colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728"]  # Blue, Orange, Green, Red
-
-
-            # Add Pie Charts for Each Barrier Count
-            for i, row in share_of_barriers.iterrows():
-                fig.add_trace(
-                    go.Pie(
-                        labels=barrier_labels,
-                        values=row[1:],  
-                        hole=0.4,  
-                        marker=dict(colors=custom_colors),  
-                        hovertemplate="<b>%{label}</b>: <b>%{value:.2f}%</b><extra></extra>"
-
-                    ),
-                    row=1, col=i+1  
-                )
 
-            for i, label in enumerate(barrier_count_labels):
-                fig.add_annotation(
-                    text=f"<b>{label}</b>",  
-                    x=i / 2,  
-                    y=-0.1,  
-                    showarrow=False,
-                    font=dict(size=14)
-                )
-
-            # Format layout
+            # Format the layout
             fig.update_layout(
-                title_text=f"Distribution of Barrier Types by Barrier Count in {selected_country}",
-                showlegend=True,
-                legend=dict(
-                    orientation="h",  
-                    yanchor="bottom",  
-                    y=1.05,  
-                    xanchor="center",  
-                    x=0.5  
-                )  
+                title=f"Impact of Sociodemographic Characteristics on the Justice Gap ({selected_country_socio})",
+                xaxis=dict(title="Average Marginal Effect (p.p.)", range = [-60,60]),
+                yaxis=dict(title=""),
+                margin=dict(l=100, r=20, t=50, b=50),
+                plot_bgcolor="white"
             )
 
-            st.plotly_chart(fig)
-
+            # Step 5: Display in Streamlit
+            return fig
+
+        if switch_in_browser:
+            countries = tuple(logistic_data["country_name_ltn"].unique())
+            st.plotly_chart(cached_chart(
+                snapshot,
+                ('forest_plot', countries),
+                lambda: charts.country_dropdown({country: build_forest_plot(country) for country in countries}, active = "EU")
+            ))
+        else:
+            st.plotly_chart(cached_chart(
+                snapshot,
+                ('forest_plot', selected_country_socio),
+                lambda: build_forest_plot(selected_country_socio)
+            ))
 
+    with barrierstab:
+        barriers_tab()
 
     with sociotab:
-        logistic_data = load_DBfile("logit_reg_gap.csv", format = 'csv')
-
-        logistic_data['female_lower'] = logistic_data['female'] - 1.96*logistic_data['female_se']
-        logistic_data['female_upper'] = logistic_data['female'] + 1.96*logistic_data['female_se']
-        logistic_data['urban_lower']  = logistic_data['urban'] - 1.96*logistic_data['urban_se']
-        logistic_data['urban_upper'] = logistic_data['urban'] + 1.96*logistic_data['urban_se']
-        logistic_data['no_hs_lower'] = logistic_data['no_hs'] - 1.96*logistic_data['no_hs_se']
-        logistic_data['no_hs_upper'] = logistic_data['no_hs'] + 1.96*logistic_data['no_hs_se']
-        logistic_data['low_es_lower'] = logistic_data['low_es'] - 1.96*logistic_data['low_es_se']
-        logistic_data['low_es_upper'] = logistic_data['low_es'] + 1.96*logistic_data['low_es_se']
-        logistic_data['less_than_30_lower'] = logistic_data['less_than_30'] - 1.96 * logistic_data['less_than_30_se']
-        logistic_data['less_than_30_upper'] = logistic_data['less_than_30'] + 1.96 * logistic_data['less_than_30_se']
-
-
-        eu_or_country_socio = st.selectbox(
-            "Would you like to focus on a specific country or the whole EU? ",
-            ["Country", "EU"],
-            index = 1
-        )
-
-        if eu_or_country_socio == "Country":
-        # Step 1: Select Country
-            selected_country_socio = st.selectbox(
-                "Select a country:",
-                logistic_data["country_name_ltn"].unique(),
-                index=0  # Default to EU
-            )
-            # Step 2: Filter Data for Selected Country
-            country_data = logistic_data[logistic_data["country_name_ltn"] == selected_country_socio].iloc[0]
-        if eu_or_country_socio == "EU":
-            country_data = logistic_data[logistic_data["country_name_ltn"] == "EU"].iloc[0]
-            selected_country_socio = "EU"
-
-        # Step 3: Reshape Data for Plotly
-        effect_data = pd.DataFrame({
-            "Characteristic": ["Female", "Urban", "No High School Diploma", "Younger than 30", "Low Economic Status"],
-            "AME": [
-                country_data["female"],
-                country_data["urban"],
-                country_data["no_hs"],
-                country_data["less_than_30"],
-                country_data["low_es"]
-            ],
-            "Lower Bound": [
-                country_data["female_lower"],
-                country_data["urban_lower"],
-                country_data["no_hs_lower"],
-                country_data["less_than_30_lower"],
-                country_data["low_es_lower"]
-            ],
-            "Upper Bound": [
-                country_data["female_upper"],
-                country_data["urban_upper"],
-                country_data["no_hs_upper"],
-                country_data["less_than_30_upper"],
-                country_data["low_es_upper"]
-            ]
-        })
-
-        # Step 4: Create the Forest Plot (Horizontal Error Bar Chart)
-        fig = go.Figure()
-
-        # Add error bars for confidence intervals
-        fig.add_trace(go.Scatter(
-            x=effect_data["AME"],
-            y=effect_data["Characteristic"],
-            mode="markers",
-            marker=dict(color="green", size=10),
-            error_x=dict(
-                type="data",
-                symmetric=False,
-                array=effect_data["Upper Bound"] - effect_data["AME"],  # Upper CI
-                arrayminus=effect_data["AME"] - effect_data["Lower Bound"]  # Lower CI
-            ),
-            hovertemplate="<b>%{y}: %{x:.2f} p.p.</b><br>" +  # Bold first line with effect value
-                  "On average, this attribute changes the probability of being in the justice gap by <b>%{x:.2f}%</b>.<br>" +  
-                  "We are 95% confident that the effect is between <b>%{customdata[0]:.2f}</b> and <b>%{customdata[1]:.2f}</b> percentage points.<extra></extra>",
-            customdata=effect_data[["Lower Bound", "Upper Bound"]].values  # Pass lower/upper bound for hover text
-
-        ))
-
-        # Add vertical line at 0% (Neutral Effect)
-        fig.add_shape(
-            type="line",
-            x0=0, x1=0,
-            y0=-0.5, y1=len(effect_data) - 0.5,
-            line=dict(color="pink", width=1.5)
-        )
-
-        # Format the layout
-        fig.update_layout(
-            title=f"Impact of Sociodemographic Characteristics on the Justice Gap ({selected_country_socio})",
-            xaxis=dict(title="Average Marginal Effect (p.p.)", range = [-60,60]),
-            yaxis=dict(title=""),
-            margin=dict(l=100, r=20, t=50, b=50),
-            plot_bgcolor="white"
-        )
-
-        # Step 5: Display in Streamlit
-        st.plotly_chart(fig)
-
-
-
-
-        
+        socio_tab()
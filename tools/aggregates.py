@@ -0,0 +1,109 @@
+"""
+Module Name:    Aggregates
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the aggregations and slices precomputed once per data generation for
+                the Justice Journey dashboard (EU-level averages, country x demographic slices).
+This version:   October 17th, 2026
+"""
+import pandas as pd
+from tools.dataloader import LazyMapping
+
+# Defining a function to normalise the spelling of the total sample across sheets
+def normalise_demographic(demographic):
+    """The sheets spell the total sample both "Total sample" and "Total Sample"."""
+    if isinstance(demographic.dtype, pd.CategoricalDtype) and "Total sample" not in demographic.cat.categories:
+        demographic = demographic.cat.add_categories("Total sample")
+    return demographic.where(demographic.str.lower() != "total sample", "Total sample")
+
+# Defining a function to average one section across all countries
+def aggregate_section(df, by, groups):
+    """Returns the EU-level averages of every metric of a section for the given demographic groups.
+
+    The metrics are all the columns but the country, the demographic and the breakdown column `by`.
+    """
+    keys    = ["demographic"] + ([by] if by else [])
+    metrics = [column for column in df.columns if column not in keys and column != "country_name_ltn"]
+
+    subset = df.assign(demographic = normalise_demographic(df["demographic"]))
+    subset = subset.loc[subset["demographic"].isin(groups), keys + metrics]
+    subset[metrics] = subset[metrics].apply(pd.to_numeric, errors = "coerce")
+
+    eu = subset.groupby(keys, observed = True)[metrics].mean().reset_index()
+    eu.insert(0, "country_name_ltn", "European Union")
+    return eu
+
+# Defining a function to split a section into per-country, per-group slices
+def split_section(df, groups):
+    """Returns a {(country, demographic group): data frame} dictionary of the national rows of `section`."""
+    df = df.assign(demographic = normalise_demographic(df["demographic"]))
+    df = df.loc[df["demographic"].isin(groups)]
+    return {key: frame for key, frame in df.groupby(["country_name_ltn", "demographic"], observed = True, sort = False)}
+
+# Defining a function to slice one section
+def build_section_slices(df, by, disaggregations):
+    """Returns the {(demographic option or group, country): data frame} slices of one section.
+
+    It holds the section sliced by country and by demographic, for both single groups
+    (e.g. "Male") and the options of the disaggregation selector (e.g. "Disagreggated by
+    Gender"), given as a {option: groups} dictionary, plus the EU-level averages under the
+    country "European Union". `by` is the column the section is broken down by, if any.
+    """
+    # empty template returned for slices without data
+    slices = {(None, None): df.iloc[0:0]}
+    for option, groups in disaggregations.items():
+        # national slices
+        pieces = split_section(df, groups)
+        for (country, group), frame in pieces.items():
+            slices[(group, country)] = frame
+        for country in df["country_name_ltn"].dropna().unique():
+            frames = [pieces[(country, group)] for group in groups if (country, group) in pieces]
+            if frames:
+                slices[(option, country)] = pd.concat(frames).sort_index()
+
+        # EU-level averages
+        eu = aggregate_section(df, by, groups)
+        slices[(option, "European Union")] = eu
+        for group in groups:
+            slices[(group, "European Union")] = eu.loc[eu["demographic"] == group]
+    return slices
+
+# Defining a function to build the section cube
+def build_section_cube(sections, breakdowns, disaggregations):
+    """Returns the section cube: a {section: slices} mapping that slices each section the first time it is read.
+
+    `breakdowns` gives the breakdown column of every section ({section: column or None}) and
+    `disaggregations` the demographic groups of every option ({option: groups}). Sections that
+    nobody opens are never loaded nor sliced.
+    """
+    return LazyMapping(
+        sections, lambda section: build_section_slices(sections[section], breakdowns[section], disaggregations)
+    )
+
+# Defining the lookup used by every chart block
+def get_section(cube, demographic, section, country):
+    """Returns the slice of `section` for a country and a demographic option or group.
+
+    Missing slices come back as an empty data frame, like an empty boolean filter would.
+    """
+    slices = cube[section]
+    frame  = slices.get((demographic, country))
+    if frame is None:
+        return slices[(None, None)]
+    return frame
+
+# Defining a function to index the GPP indicator values
+def build_indicator_index(gpp_datapoints):
+    """Returns a {(country, level, id, demographic): value} dictionary of the GPP data points.
+
+    Like the `.iloc[0]` lookups it replaces, the first row wins when a key is repeated.
+    """
+    keys = ["country", "level", "id", "demographic"]
+    gpp  = gpp_datapoints.drop_duplicates(subset = keys, keep = "first")
+    return dict(zip(gpp[keys].itertuples(index = False, name = None), gpp["value"]))
+
+# Defining a function to list the countries offered by the dashboard's country selector
+def build_country_list(gpp_datapoints):
+    """Returns the countries of the GPP data points in order of appearance (Ireland is excluded)."""
+    countries = gpp_datapoints.loc[gpp_datapoints["country"] != "Ireland", "country"]
+    return tuple(countries.drop_duplicates())
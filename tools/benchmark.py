@@ -0,0 +1,52 @@
+"""
+Module Name:    Benchmark
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module times the parsing of every dashboard input with each installed reader engine,
+                so every deployment can pick its fastest engines (`csv_engines`, `excel_engines` secrets).
+                Run it from the repository root with `python -m tools.benchmark <inputs folder> [repeats]`.
+This version:   October 17th, 2026
+"""
+import os
+import sys
+import time
+from tools import dataloader, datastore
+
+# Defining a function to time one engine on one file
+def time_engine(content, spec, engine, repeats):
+    """Returns the best parse time (in seconds) of a file over `repeats` runs, or the error raised."""
+    columns = dataloader.file_columns(spec["format"], spec.get("columns"))
+    best    = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        try:
+            dataloader.parse_file(content, spec["format"], spec.get("sheets"), columns, engines = [engine])
+        except Exception as e:
+            return e
+        seconds = time.perf_counter() - start
+        best    = seconds if best is None else min(best, seconds)
+    return best
+
+def run(folder = ".", repeats = 5):
+    """Prints the parse time of every input of `folder` with every installed engine of its format."""
+    print(f"{'file':<36} {'engine':<10} {'seconds':>10}")
+    for spec in datastore.DATASETS.values():
+        path = os.path.join(folder, spec["file"])
+        if not os.path.exists(path):
+            print(f"{spec['file']:<36} {'-':<10} {'missing':>10}")
+            continue
+        with open(path, "rb") as f:
+            content = f.read()
+        for engine in dataloader.READER_ENGINES[spec["format"]]:
+            if not dataloader.engine_installed(engine):
+                result = "not installed"
+            else:
+                result = time_engine(content, spec, engine, repeats)
+                result = f"{result:.4f}" if isinstance(result, float) else f"failed ({type(result).__name__})"
+            print(f"{spec['file']:<36} {engine:<10} {result:>10}")
+
+if __name__ == "__main__":
+    run(
+        sys.argv[1] if len(sys.argv) > 1 else ".",
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    )
@@ -0,0 +1,170 @@
+"""
+Module Name:    Charts
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the chart helpers shared by the EU Justice Dashboard pages.
+This version:   October 17th, 2026
+"""
+import threading
+from collections import OrderedDict
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+# Defining a function to map every category of a column to a colour of the default Plotly palette
+def category_colors(categories, palette = px.colors.qualitative.Plotly):
+    """Returns a {category: colour} dictionary, assigning colours in order of appearance."""
+    unique = dict.fromkeys(categories)
+    return {category: palette[i % len(palette)] for i, category in enumerate(unique)}
+
+# Defining a function to draw a lollipop chart with as few traces as possible
+def add_lollipops(fig, df, x, y, color, name = None, hovertemplate = None, row = None, col = None):
+    """Adds a horizontal lollipop chart (a stem from 0 to `x` and a marker at its end) to `fig`.
+
+    `color` is either a single colour or a {category: colour} mapping over the `y` column.
+    All markers go into one trace, and all stems of the same colour go into one line trace
+    made of None-separated segments, instead of one trace per row.
+    """
+    values     = df[x].to_numpy(dtype = float)
+    categories = df[y].to_numpy(dtype = object)
+    if isinstance(color, dict):
+        colors = np.array([color[category] for category in categories], dtype = object)
+    else:
+        colors = np.full(len(categories), color, dtype = object)
+
+    fig.add_trace(
+        go.Scatter(
+            x = values,
+            y = categories,
+            mode = 'markers',
+            marker = dict(color = colors.tolist() if isinstance(color, dict) else color),
+            name = name,
+            hovertemplate = hovertemplate
+        ),
+        row = row, col = col
+    )
+
+    for stem_color in dict.fromkeys(colors):
+        selected = colors == stem_color
+        n        = int(selected.sum())
+        # every stem is (0, value) followed by a gap
+        stems_x  = np.column_stack([np.zeros(n), values[selected], np.full(n, np.nan)]).ravel()
+        stems_y  = np.column_stack([categories[selected], categories[selected], np.full(n, None)]).ravel()
+        fig.add_trace(
+            go.Scatter(
+                x = stems_x,
+                y = stems_y,
+                mode = 'lines',
+                line = dict(color = stem_color, width = 2),
+                hoverinfo = 'skip',
+                showlegend = False
+            ),
+            row = row, col = col
+        )
+    return fig
+
+# Defining a function to merge per-country figures into one figure with a country menu
+def country_dropdown(figures, active = None):
+    """Returns one figure holding the traces of every figure of `figures` ({country: figure}).
+
+    Only the traces of the `active` country (the first one by default) are visible. A dropdown
+    menu switches the visible traces and the title in the browser, without rerunning the page.
+    """
+    countries = list(figures)
+    active    = active if active in figures else countries[0]
+
+    merged = go.Figure(layout = figures[active].layout)
+    owners = []
+    for country in countries:
+        traces = [trace.to_plotly_json() for trace in figures[country].data]
+        merged.add_traces([dict(trace, visible = country == active) for trace in traces])
+        owners.extend([country] * len(traces))
+    owners = np.array(owners, dtype = object)
+
+    buttons = [
+        dict(
+            label  = str(country),
+            method = "update",
+            args   = [{"visible": (owners == country).tolist()}, {"title.text": figures[country].layout.title.text}]
+        )
+        for country in countries
+    ]
+    merged.update_layout(
+        updatemenus = [dict(
+            buttons = buttons,
+            active  = countries.index(active),
+            direction = "down",
+            x = 1, xanchor = "right",
+            y = 1.15, yanchor = "bottom"
+        )]
+    )
+    return merged
+
+# Defining a function to build the keys of chart elements
+def chart_key(chart, *parts, version):
+    """Returns a deterministic element key built from the chart name, its slice and the data generation.
+
+    The same chart of the same slice gets the same key on every rerun, so the frontend updates the
+    mounted chart instead of tearing it down and creating a new one.
+    """
+    return "_".join(str(part) for part in (chart, *parts, f"v{version}"))
+
+# Defining the figure cache shared by every session
+class FigureCache:
+    """Thread-safe LRU cache of the rendered figures, keyed by slice and data generation.
+
+    A figure only depends on the slice it shows (page, chart, country, demographic...) and on
+    the snapshot it was built from, so every session asking for the same slice of the same
+    generation reuses it. Entries of older generations are dropped as soon as a newer one shows up.
+    """
+
+    def __init__(self, max_entries = 256):
+        self.max_entries = max_entries
+        self._figures    = OrderedDict()
+        self._version    = None
+        self._lock       = threading.Lock()
+        self.hits        = 0
+        self.misses      = 0
+
+    def get(self, key, version, build):
+        """Returns the figure cached under (`key`, `version`), calling `build()` to create it on a miss."""
+        with self._lock:
+            figure = self._figures.get((version, key))
+            if figure is not None:
+                self._figures.move_to_end((version, key))
+                self.hits += 1
+                return figure
+            self.misses += 1
+
+        # figures are built outside the lock; two sessions missing the same key just build it twice
+        figure = build()
+
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._figures.clear()
+                self._version = version
+            if version == self._version:
+                self._figures[(version, key)] = figure
+                while len(self._figures) > self.max_entries:
+                    self._figures.popitem(last = False)
+        return figure
+
+    def stats(self):
+        """Returns the hit/miss counters and the number of cached figures."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._figures), "version": self._version}
+
+@st.cache_resource(show_spinner = False)
+def get_figure_cache(max_entries):
+    """Returns the process-wide figure cache."""
+    return FigureCache(max_entries)
+
+def cached_figure(key, version, build):
+    """Returns the figure of `key` for the data generation `version`, built once per process.
+
+    Cached figures are shared by every session and must not be modified after this call.
+    The cache size is set with the `figure_cache_size` secret (default: 256 figures).
+    """
+    cache = get_figure_cache(int(st.secrets.get("figure_cache_size", 256)))
+    return cache.get(key, version, build)
@@ -0,0 +1,313 @@
+"""
+Module Name:    Data Loader
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the functions used by the EU Justice Dashboard to download its
+                inputs from a data source and keep a columnar (Parquet) copy of them on local disk.
+This version:   October 17th, 2026
+"""
+import os
+import time
+import logging
+import threading
+import importlib.util
+from collections import Counter
+from collections.abc import Mapping
+import pandas as pd
+import streamlit as st
+from io import BytesIO
+from tools.diskcache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Defining the counters shared by every load in the server process
+class LoadMetrics:
+    """Thread-safe event counters and cumulative timings of the data loads."""
+
+    def __init__(self):
+        self._lock   = threading.Lock()
+        self.counts  = Counter()
+        self.seconds = Counter()
+
+    def record(self, event, seconds = 0.0):
+        with self._lock:
+            self.counts[event]  += 1
+            self.seconds[event] += seconds
+
+    def as_dict(self):
+        with self._lock:
+            return {event: {"count": self.counts[event], "seconds": self.seconds[event]} for event in self.counts}
+
+METRICS = LoadMetrics()
+
+# Defining the process-wide disk cache
+@st.cache_resource(show_spinner = False)
+def get_disk_cache(folder, max_bytes):
+    """Returns the disk cache stored under `folder`, reading its manifest once per process."""
+    return DiskCache(folder, max_bytes)
+
+def get_cache():
+    """Returns the disk cache configured through the app secrets (`cache_dir`, `cache_max_mb`)."""
+    return get_disk_cache(
+        st.secrets.get("cache_dir", os.path.join(".streamlit", "cache")),
+        int(float(st.secrets.get("cache_max_mb", 512)) * 1024 ** 2)
+    )
+
+# Reader engines of every format, fastest first, and the package each one needs. The pyarrow CSV
+# reader parses with multiple threads; calamine is a Rust-based xlsx reader.
+READER_ENGINES = {
+    "csv"   : ["pyarrow", "c"],
+    "excel" : ["calamine", "openpyxl"],
+}
+ENGINE_PACKAGES = {"pyarrow": "pyarrow", "calamine": "python_calamine", "openpyxl": "openpyxl"}
+
+# Defining the functions selecting the reader engines
+def engine_installed(engine):
+    """Returns True if the package behind a reader engine can be imported."""
+    package = ENGINE_PACKAGES.get(engine)
+    return package is None or importlib.util.find_spec(package) is not None
+
+def get_engines(format):
+    """Returns the installed reader engines of a format, in order of preference.
+
+    The order can be changed with the `csv_engines` and `excel_engines` secrets (a list, or a
+    comma-separated string). Engines whose package is not installed are skipped.
+    """
+    engines = st.secrets.get(f"{format}_engines", READER_ENGINES[format])
+    if isinstance(engines, str):
+        engines = [engine.strip() for engine in engines.split(",")]
+    return [engine for engine in engines if engine_installed(engine)]
+
+# Defining a function to parse raw file contents into data frames
+def parse_file(content, format, sheets = None, columns = None, engines = None):
+    """Returns a {name: data frame} dictionary. CSV files are stored under the name `data`.
+
+    `columns` ({name: {column: dtype}}) restricts a frame to the listed columns and converts them to
+    their dtypes (see `coerce`).
+    The file is parsed with the first of `engines` (by default, `get_engines(format)`) that succeeds;
+    pandas' default engine is used when none of them is installed.
+    """
+    engines = get_engines(format) if engines is None else engines
+    columns = columns or {}
+    error   = None
+    with BytesIO(content) as file:
+        for engine in engines or [None]:
+            try:
+                file.seek(0)
+                return read_frames(file, format, sheets, columns, engine)
+            except Exception as e:
+                METRICS.record("parse_fallback")
+                logger.warning("Could not parse a %s file with the %s engine: %s", format, engine, e)
+                error = e
+    raise error
+
+def read_frames(file, format, sheets, columns, engine):
+    """Parses an open file with one reader engine."""
+    if format == 'excel':
+        with pd.ExcelFile(file, engine = engine) as workbook:
+            return {
+                sheet: coerce(workbook.parse(sheet, **projection(columns.get(sheet))), columns.get(sheet))
+                for sheet in sheets
+            }
+    if format == 'csv':
+        return {"data": coerce(pd.read_csv(file, engine = engine, **projection(columns.get("data"))), columns.get("data"))}
+
+def projection(columns):
+    """Returns the reader arguments that only parse `columns` ({column: dtype}), or none for every column.
+
+    Only text columns are typed by the reader, since any cell can be read as text; numeric columns
+    are converted afterwards by `coerce`, so a single bad cell cannot fail the whole file.
+    """
+    if columns is None:
+        return {}
+    return {"usecols": list(columns), "dtype": {column: dtype for column, dtype in columns.items() if dtype == "str"}}
+
+def coerce(df, columns):
+    """Returns `df` with its numeric `columns` ({column: dtype}) converted to their dtypes.
+
+    Cells that are not numbers (or not whole numbers, for integer columns) become missing values,
+    so integer columns should use a nullable dtype such as "Int64".
+    """
+    if columns is None:
+        return df
+    converted = {}
+    for column, dtype in columns.items():
+        if dtype == "str" or column not in df.columns:
+            continue
+        values = pd.to_numeric(df[column], errors = "coerce")
+        if pd.api.types.is_integer_dtype(dtype):
+            values = values.where(values % 1 == 0)
+        converted[column] = values.astype(dtype)
+    return df.assign(**converted)
+
+def file_columns(format, columns):
+    """Returns the {name: {column: dtype}} projection of a file from a dataset's `columns` declaration.
+
+    CSV files declare a {column: dtype} dictionary, Excel files one per sheet.
+    """
+    if columns is None:
+        return None
+    return {"data": columns} if format == 'csv' else dict(columns)
+
+# Defining how often cached copies are revalidated against Dropbox
+def get_revalidate_every():
+    """Returns the revalidation interval in seconds (secret `revalidate_every`, defaults to 10 minutes)."""
+    return float(st.secrets.get("revalidate_every", 600))
+
+# Defining the mapping handed out for sheets (and other parts) that are only loaded on demand
+class LazyMapping(Mapping):
+    """Read-only {name: value} mapping that calls `load(name)` the first time each name is read.
+
+    Every value is loaded at most once, also when several sessions ask for it at the same time.
+    """
+
+    def __init__(self, names, load):
+        self._names  = tuple(names)
+        self._load   = load
+        self._values = {}
+        self._locks  = {name: threading.Lock() for name in self._names}
+
+    def __getitem__(self, name):
+        if name not in self._locks:
+            raise KeyError(name)
+        if name not in self._values:
+            with self._locks[name]:
+                if name not in self._values:
+                    self._values[name] = self._load(name)
+        return self._values[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def loaded(self):
+        """Returns the names that have been loaded so far."""
+        return [name for name in self._names if name in self._values]
+
+    def map(self, transform):
+        """Returns a lazy mapping of `transform(name, value)` over this one.
+
+        The transforms are composed into the loader of the new mapping, so only the transformed
+        values are kept: the values of this mapping are not stored by reads through the new one.
+        """
+        def load(name):
+            value = self._values[name] if name in self._values else self._load(name)
+            return transform(name, value)
+        return LazyMapping(self._names, load)
+
+# Defining the error raised when the copy of an older version of a file is no longer available
+class StaleCopyError(RuntimeError):
+    """The cached copy a data generation was built from has been evicted and the file has changed since."""
+
+# Defining a function to download and parse a file, keeping a columnar copy of it on disk
+def download_file(source, file, format, sheets, cache, columns = None):
+    """Returns the (FileInfo, {name: data frame}) of a freshly downloaded file, parsing only `columns` if given."""
+    start = time.perf_counter()
+    metadata, content = source.download(file)
+    METRICS.record("download", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    dfs = parse_file(content, format, sheets, columns)
+    METRICS.record("parse", time.perf_counter() - start)
+    cache.put(metadata.content_hash, dfs)
+    return metadata, dfs
+
+# Defining a function to bring the disk copy of a file up to date
+def revalidate_file(source, file, format, sheets = None, cache = None, revalidate_every = None, columns = None):
+    """Makes sure the disk cache holds the current version of a file and returns (key, dfs).
+
+    `key` is the content hash of the copy to read. A copy checked less than `revalidate_every`
+    seconds ago is trusted without contacting the source. Otherwise its `rev` and `content_hash`
+    are compared with the copy's through `source.get_metadata`, and the file is only downloaded
+    and parsed if it actually changed, in which case `dfs` holds the freshly parsed frames (it is
+    None otherwise). If the source cannot be reached, a complete copy on disk is used anyway.
+    """
+    if cache is None:
+        cache = get_cache()
+    if revalidate_every is None:
+        revalidate_every = get_revalidate_every()
+    names   = ["data"] if format == 'csv' else list(sheets)
+    columns = file_columns(format, columns)
+
+    cached = cache.source(file)
+    key    = cached["key"] if cached is not None and cache.has(cached["key"], names, columns) else None
+
+    if key is not None and time.time() - cached.get("checked_at", 0) < revalidate_every:
+        METRICS.record("disk_hit")
+        return key, None
+
+    # conditional revalidation: only the metadata travels when nothing changed
+    start = time.perf_counter()
+    try:
+        metadata = source.get_metadata(file)
+    except Exception as e:
+        if key is None:
+            raise
+        # Keep serving the copy on disk; it stays due for revalidation on the next load
+        METRICS.record("revalidation_failed", time.perf_counter() - start)
+        logger.warning("Could not revalidate %s, serving its cached copy: %s", file, e)
+        return key, None
+    METRICS.record("revalidation", time.perf_counter() - start)
+
+    dfs = None
+    if key is None or (metadata.rev, metadata.content_hash) != (cached.get("rev"), cached.get("content_hash")):
+        # columnar copies are keyed by the content hash of the source file
+        key = metadata.content_hash
+        if not cache.has(key, names, columns):
+            metadata, dfs = download_file(source, file, format, sheets, cache, columns)
+            key = metadata.content_hash
+
+    cache.set_source(
+        file, key,
+        content_hash = metadata.content_hash, rev = metadata.rev, checked_at = time.time()
+    )
+    return key, dfs
+
+# Defining the main loading function
+def open_file(source, file, format, sheets, cache, key, dfs = None, lazy = False, columns = None):
+    """Loads the copy of `file` stored under `key` by `revalidate_file` (see tools/datasources.py).
+
+    Returns a data frame for CSV files and a {sheet: data frame} dictionary for Excel files. With
+    `lazy`, Excel sheets come back as a LazyMapping and each of them is only read from disk the
+    first time it is used. `columns` lists the columns to load and their dtypes ({column: dtype}
+    for CSV files, {sheet: {column: dtype}} for Excel files): only those are parsed from the
+    source and read from the Parquet copy. `dfs` are the frames just parsed by `revalidate_file`,
+    if any, which are served instead of reading the copy back from disk.
+    """
+    names = ["data"] if format == 'csv' else list(sheets)
+    if dfs is not None:
+        if lazy and format == 'excel':
+            return LazyMapping(names, dfs.__getitem__)
+        return unpack(dfs, format, names)
+    return read_file(source, file, format, names, cache, key, lazy, file_columns(format, columns))
+
+def read_file(source, file, format, names, cache, key, lazy = False, columns = None):
+    """Reads the copy of `file` stored on disk under `key` (downloading it again if it was evicted).
+
+    Raises StaleCopyError if the copy was evicted and the file has changed since: its current
+    contents belong to a newer data generation than the one that asked for `key`.
+    """
+    def read(subset):
+        dfs = cache.get(key, subset, columns)
+        if dfs is None:
+            metadata, dfs = download_file(source, file, format, names if format == 'excel' else None, cache, columns)
+            if metadata.content_hash != key:
+                raise StaleCopyError(f"{file} changed after its copy {key} was evicted from the disk cache")
+        return dfs
+
+    if lazy and format == 'excel':
+        def read_sheet(name):
+            start = time.perf_counter()
+            df    = read([name])[name]
+            METRICS.record("sheet_read", time.perf_counter() - start)
+            return df
+        return LazyMapping(names, read_sheet)
+    return unpack(read(names), format, names)
+
+def unpack(dfs, format, names):
+    """Returns a data frame for CSV files and a {sheet: data frame} dictionary for Excel files."""
+    if format == 'csv':
+        return dfs["data"]
+    return {name: dfs[name] for name in names}
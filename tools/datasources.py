@@ -0,0 +1,90 @@
+"""
+Module Name:    Data Sources
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the backends the EU Justice Dashboard can read its input files from:
+                Dropbox (production) and a local folder (offline testing and air-gapped deployments).
+This version:   October 17th, 2026
+"""
+import os
+import hashlib
+from collections import namedtuple
+import streamlit as st
+from tools import passcheck, dbclient
+
+# Metadata every backend reports for a file. `content_hash` follows the Dropbox content hash
+# algorithm, so a local mirror and Dropbox share the same disk cache entries.
+FileInfo = namedtuple("FileInfo", ["rev", "content_hash"])
+
+# Defining the interface implemented by every backend
+class DataSource:
+    """Base class of the data-source backends."""
+
+    def get_metadata(self, file):
+        """Returns the FileInfo of `file` without downloading it."""
+        raise NotImplementedError
+
+    def download(self, file):
+        """Returns a (FileInfo, raw bytes) tuple for `file`."""
+        raise NotImplementedError
+
+# Defining the Dropbox backend
+class DropboxSource(DataSource):
+    """Reads files from the root of the app's Dropbox folder."""
+
+    def __init__(self, get_client):
+        self.get_client = get_client    # callable returning a ready-to-use Dropbox client
+
+    def get_metadata(self, file):
+        metadata = self.get_client().files_get_metadata(f"/{file}")
+        return FileInfo(metadata.rev, metadata.content_hash)
+
+    def download(self, file):
+        metadata, res = self.get_client().files_download(f"/{file}")
+        return FileInfo(metadata.rev, metadata.content_hash), res.content
+
+# Defining the local folder backend
+class LocalSource(DataSource):
+    """Reads files from a local folder mirroring the Dropbox one."""
+
+    def __init__(self, folder):
+        self.folder = folder
+
+    def _path(self, file):
+        return os.path.join(self.folder, file)
+
+    def _info(self, path, content):
+        stat = os.stat(path)
+        return FileInfo(f"{stat.st_mtime_ns:x}{stat.st_size:x}", dropbox_content_hash(content))
+
+    def get_metadata(self, file):
+        return self.download(file)[0]
+
+    def download(self, file):
+        path = self._path(file)
+        with open(path, "rb") as f:
+            content = f.read()
+        return self._info(path, content), content
+
+# Defining a function that reproduces the Dropbox content hash of a file
+def dropbox_content_hash(content, block_size = 4 * 1024 * 1024):
+    """SHA-256 of the concatenated SHA-256 digests of every 4 MB block."""
+    block_hashes = b"".join(
+        hashlib.sha256(content[i:i + block_size]).digest() for i in range(0, len(content), block_size)
+    )
+    return hashlib.sha256(block_hashes).hexdigest()
+
+# Defining a function to build the backend selected in the app secrets
+def get_source():
+    """Returns the backend selected by the `data_source` secret (`dropbox`, the default, or `local`)."""
+    backend = st.secrets.get("data_source", "dropbox")
+
+    if backend == "local":
+        return LocalSource(st.secrets.get("local_dir", os.path.join(".streamlit", "inputs")))
+
+    if backend == "dropbox":
+        token_manager  = passcheck.get_DBtoken_manager(st.secrets["dbkey"], st.secrets["dbsecret"], st.secrets["dbtoken"])
+        client_manager = dbclient.get_configured_DBclient_manager()
+        return DropboxSource(lambda: client_manager.get(token_manager.get()))
+
+    raise ValueError(f"Unknown data source '{backend}'. Valid options are 'dropbox' and 'local'.")
@@ -0,0 +1,273 @@
+"""
+Module Name:    Data Store
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the process-wide store that holds every input of the EU Justice
+                Dashboard, refreshes them in a background thread and hands consistent snapshots to
+                the pages.
+This version:   October 17th, 2026
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import streamlit as st
+from tools import dataloader, datasources, aggregates, dtypes, suppression, sections
+
+logger = logging.getLogger(__name__)
+
+# Shared frames are handed out by reference: Copy-on-Write keeps every derived frame independent
+# of them without paying for an upfront copy
+pd.set_option("mode.copy_on_write", True)
+
+# Defining the preprocessing steps applied once per data generation
+def add_confidence_intervals(df):
+    """Adds the 95% confidence bounds (`<var>_lower`, `<var>_upper`) of every marginal effect."""
+    for var in ["female", "urban", "no_hs", "low_es", "less_than_30"]:
+        df[f"{var}_lower"] = df[var] - 1.96 * df[f"{var}_se"]
+        df[f"{var}_upper"] = df[var] + 1.96 * df[f"{var}_se"]
+    return df
+
+# Labels of the economic status groups (`fintight`)
+INCOME_LABELS = {1: "Low ES", 0: "High ES"}
+
+def add_combined_group(df):
+    """Adds the gender x economic status label (e.g. "Female - Low ES") used by the combined disaggregation."""
+    df["combined_group"] = dtypes.combine(df["gender"], df["fintight"].cat.rename_categories(INCOME_LABELS), sep = " - ")
+    return df
+
+def suppress_workbook(sheets, rules):
+    """Applies the {sheet: rule} suppression rules to every sheet of a workbook (lazily for lazy workbooks)."""
+    if isinstance(sheets, dataloader.LazyMapping):
+        return sheets.map(suppression.suppress_sheets(rules))
+    return {sheet: suppression.suppress(df, rules.get(sheet)) for sheet, df in sheets.items()}
+
+# Defining the columns the pages use in every input, and the dtypes they are parsed with
+def floats(*columns):
+    return dict.fromkeys(columns, "float64")
+
+# (the columns of the Justice Journey sheets are derived from the dashboard registry, see tools/sections.py)
+SECTION_COLUMNS = sections.SECTION_COLUMNS
+BARRIER_COUNTS = floats("pct_0_barriers", "pct_1_barrier", "pct_2_barrier", "pct_3_barriers", "pct_4_barriers")
+BARRIER_TYPES  = floats(*(
+    f"pct_{barrier}_barrier_barrier_{rank}" for barrier in ["solution", "info", "dcf", "representation"] for rank in [1, 2, 3]
+))
+GPP_COLUMNS    = {"country": "str", "level": "str", "id": "str", "demographic": "str", "value": "float64"}
+LOGIT_COLUMNS  = {"country_name_ltn": "str", **floats(*(
+    f"{var}{suffix}" for var in ["female", "urban", "no_hs", "low_es", "less_than_30"] for suffix in ["", "_se"]
+))}
+
+# Defining the small-cell suppression of the sections: rows based on fewer than 30 observations are blanked
+SECTION_SUPPRESSION = {sheet: suppression.rule(spec["count"]) for sheet, spec in sections.SHEETS.items()}
+
+# Defining every input used by the dashboard pages. Only the `columns` of an input are parsed and
+# read from disk, and the cells selected by its `suppress` rule ({sheet: rule} for workbooks) are
+# blanked once per data generation. The sheets of `lazy` inputs are only read (and suppressed) the
+# first time a page uses them.
+SECTIONS = tuple(SECTION_COLUMNS)
+DATASETS = {
+    "gpp_datapoints"  : {"file": "data4web_gpp.csv",                 "format": "csv",   "columns": GPP_COLUMNS},
+    "sections"        : {"file": "A2J_justicejourney_wrangled.xlsx", "format": "excel", "columns": SECTION_COLUMNS, "sheets": SECTIONS, "lazy": True, "suppress": SECTION_SUPPRESSION},
+    "barriers"        : {"file": "barriers.csv",                     "format": "csv",   "columns": {"country_name_ltn": "str", **floats("pct_in_gap", "pct_not_in_gap"), **BARRIER_COUNTS, **BARRIER_TYPES}},
+    "barriers_gender" : {"file": "justice_gap_gend.csv",             "format": "csv",   "columns": {"country_name_ltn": "str", "gender": "str", **BARRIER_COUNTS, **BARRIER_TYPES}},
+    "barriers_income" : {"file": "justice_gap_es.csv",               "format": "csv",   "columns": {"country_name_ltn": "str", "fintight": "Int64", **BARRIER_COUNTS, **BARRIER_TYPES}},
+    "barriers_both"   : {"file": "dem_breakdowns_justice_gap.csv",   "format": "csv",   "columns": {"country_name_ltn": "str", "gender": "str", "fintight": "Int64", **BARRIER_COUNTS, **BARRIER_TYPES}, "preprocess": add_combined_group},
+    "logit_reg_gap"   : {"file": "logit_reg_gap.csv",                "format": "csv",   "columns": LOGIT_COLUMNS, "preprocess": add_confidence_intervals},
+}
+
+# Defining the data derived from the inputs, built once per data generation
+DERIVED = {
+    "section_cube"    : lambda datasets: aggregates.build_section_cube(
+        datasets["sections"],
+        {sheet: spec["by"] for sheet, spec in sections.SHEETS.items()},
+        sections.DEMOGRAPHIC_GROUPS
+    ),
+    "indicator_index" : lambda datasets: aggregates.build_indicator_index(datasets["gpp_datapoints"]),
+    "country_list"    : lambda datasets: aggregates.build_country_list(datasets["gpp_datapoints"]),
+}
+
+# Defining the snapshot class
+class Snapshot:
+    """An immutable generation of every dashboard input.
+
+    `version` increases by one every time a refresh finds new data. Pages should grab
+    the current snapshot once per rerun and read all of their inputs from it, so a
+    rerun never mixes data from two generations.
+    """
+
+    def __init__(self, version, datasets, fingerprint, memory = None, dictionary = None):
+        self.version     = version
+        self.datasets    = datasets
+        self.fingerprint = fingerprint
+        self.memory      = memory or dtypes.MemoryReport()   # memory saved by the compact dtypes
+        self.dictionary  = dictionary                       # category dictionary of the generation
+        self.created_at  = time.time()
+
+    def get(self, name):
+        """Returns a dataset (a data frame, or a {sheet: data frame} mapping) by reference.
+
+        The frames are shared by every session and must be treated as read-only. Copy-on-Write
+        is enabled below, so filtering or adding columns to a derived frame never touches them.
+        The sheets of lazy datasets are only loaded when they are first read.
+        """
+        data = self.datasets[name]
+        if isinstance(data, dict):
+            return dict(data)
+        return data
+
+# Defining the store class
+class DataStore:
+    """Owns the refreshes of all dashboard inputs and the reference to the current snapshot.
+
+    New snapshots are built completely off the request path and published with a single
+    reference assignment, so readers always see either the old or the new generation.
+    """
+
+    def __init__(self, source, cache, interval, workers = 8):
+        self.source     = source        # data-source backend (see tools/datasources.py)
+        self.cache      = cache
+        self.interval   = interval
+        self.workers    = workers       # number of inputs loaded concurrently
+        self._snapshot  = None
+        self._lock      = threading.Lock()
+        self._thread    = None
+        self._refreshes = {"count": 0, "failures": 0, "last_seconds": None}
+
+    def refresh(self):
+        """Reloads every input and publishes a new snapshot if any of them changed."""
+        with self._lock:
+            start = time.perf_counter()
+            try:
+                snapshot = self._build()
+            except Exception:
+                self._refreshes["failures"] += 1
+                raise
+            self._refreshes["count"]       += 1
+            self._refreshes["last_seconds"] = time.perf_counter() - start
+            self._snapshot = snapshot
+            # the lazy sheets of the published generation must stay readable from disk
+            self.cache.pin(key for key in snapshot.fingerprint.values() if key is not None)
+            return snapshot
+
+    def _build(self):
+        # every input is revalidated first (concurrently, so a cold start takes as long as the slowest
+        # file), and only the inputs whose version changed are read back from disk
+        with ThreadPoolExecutor(max_workers = self.workers, thread_name_prefix = "datastore-loader") as pool:
+            futures = {
+                name: pool.submit(
+                    dataloader.revalidate_file,
+                    self.source, spec["file"], spec["format"], spec.get("sheets"),
+                    cache = self.cache, revalidate_every = self.interval, columns = spec.get("columns")
+                )
+                for name, spec in DATASETS.items()
+            }
+            revalidated = {name: future.result() for name, future in futures.items()}
+        fingerprint = {name: key for name, (key, _) in revalidated.items()}
+
+        current = self._snapshot
+        if current is not None and fingerprint == current.fingerprint:
+            return current
+        changed = [
+            name for name in DATASETS
+            if current is None or fingerprint[name] != current.fingerprint.get(name)
+        ]
+
+        with ThreadPoolExecutor(max_workers = self.workers, thread_name_prefix = "datastore-loader") as pool:
+            futures = {
+                name: pool.submit(
+                    dataloader.open_file,
+                    self.source, DATASETS[name]["file"], DATASETS[name]["format"], DATASETS[name].get("sheets"),
+                    self.cache, *revalidated[name], lazy = DATASETS[name].get("lazy", False),
+                    columns = DATASETS[name].get("columns")
+                )
+                for name in changed
+            }
+            loaded = {name: future.result() for name, future in futures.items()}
+
+        # unchanged inputs are carried over from the current generation as they are; the dictionary
+        # only ever grows, so their category codes stay valid in the new generation
+        unchanged  = [name for name in DATASETS if name not in loaded]
+        dictionary = current.dictionary.copy() if current is not None else dtypes.CategoryDictionary()
+        memory     = current.memory.subset(unchanged) if current is not None else dtypes.MemoryReport()
+        datasets   = {name: current.datasets[name] for name in unchanged}
+
+        # dimension columns share one category dictionary per generation and metrics are downcast;
+        # lazy sheets are compacted with the same dictionary when they are first read
+        for name, df in loaded.items():
+            if DATASETS[name].get("lazy"):
+                def compact_sheet(sheet, df, name = name):
+                    dtypes.register(dictionary, df)
+                    return dtypes.compact(df, dictionary, memory, f"{name}/{sheet}")
+                datasets[name] = df.map(compact_sheet)
+            else:
+                dtypes.register(dictionary, df)
+        for name, df in loaded.items():
+            if not DATASETS[name].get("lazy"):
+                datasets[name] = dtypes.compact(df, dictionary, memory, name)
+
+        for name in loaded:
+            spec = DATASETS[name]
+            if "suppress" in spec and spec["format"] == "excel":
+                datasets[name] = suppress_workbook(datasets[name], spec["suppress"])
+            elif "suppress" in spec:
+                datasets[name] = suppression.suppress(datasets[name], spec["suppress"])
+            if "preprocess" in spec:
+                datasets[name] = spec["preprocess"](datasets[name])
+        for name, build in DERIVED.items():
+            datasets[name] = build(datasets)
+
+        version = current.version + 1 if current is not None else 1
+        snapshot = Snapshot(version, datasets, fingerprint, memory, dictionary)
+        logger.info("Data generation %s: compact dtypes saved %s bytes", version, memory.as_dict()["saved"])
+        return snapshot
+
+    def snapshot(self):
+        """Returns the current snapshot, loading the data first if nothing has been loaded yet."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        return snapshot
+
+    def metrics(self):
+        """Returns the refresh statistics of the store, the load counters of the process and the
+        memory saved by the compact dtypes of the current snapshot."""
+        snapshot = self._snapshot
+        return {
+            "version"   : snapshot.version if snapshot is not None else None,
+            "refreshes" : dict(self._refreshes),
+            "loads"     : dataloader.METRICS.as_dict(),
+            "memory"    : snapshot.memory.as_dict() if snapshot is not None else None
+        }
+
+    def start(self):
+        """Starts the background refresher thread (once)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target = self._run, name = "datastore-refresher", daemon = True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the current snapshot; the next cycle will try again
+                logger.exception("Background data refresh failed")
+
+@st.cache_resource(show_spinner = "Loading data...")
+def get_datastore():
+    """Returns the process-wide data store, loading the first snapshot and starting its refresher."""
+    store = DataStore(
+        source     = datasources.get_source(),
+        cache      = dataloader.get_cache(),
+        interval   = dataloader.get_revalidate_every(),
+        workers    = int(st.secrets.get("prefetch_workers", 8))
+    )
+    store.refresh()
+    store.start()
+    return store
+
+def get_snapshot():
+    """Returns the current snapshot of the shared data store. Call it once per rerun."""
+    return get_datastore().snapshot()
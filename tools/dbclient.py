@@ -0,0 +1,51 @@
+"""
+Module Name:    Dropbox Client
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the process-wide Dropbox client shared by every page and session
+                of the EU Justice Dashboard.
+This version:   October 17th, 2026
+"""
+import streamlit as st
+import dropbox
+import threading
+
+# Defining a class that owns the Dropbox client and its connection pool
+class DBClientManager:
+    """Hands out a `dropbox.Dropbox` client bound to a shared, pooled HTTP session.
+
+    The session (and therefore its warm connections) lives for the whole server
+    process. The client itself is only rebuilt when the access token rotates.
+    """
+
+    def __init__(self, pool_size = 8, connect_timeout = 10, read_timeout = 100):
+        self.session = dropbox.create_session(max_connections = pool_size)
+        self.timeout = (connect_timeout, read_timeout)
+        self._state  = (None, None)    # (access token, client)
+        self._lock   = threading.Lock()
+
+    def get(self, token):
+        """Returns a client for `token`, reusing the current one when the token has not changed."""
+        current_token, client = self._state
+        if client is not None and current_token == token:
+            return client
+
+        with self._lock:
+            current_token, client = self._state
+            if client is None or current_token != token:
+                client = dropbox.Dropbox(token, session = self.session, timeout = self.timeout)
+                self._state = (token, client)
+            return client
+
+@st.cache_resource(show_spinner = False)
+def get_DBclient_manager(pool_size, connect_timeout, read_timeout):
+    """Returns the process-wide client manager for a given pool configuration."""
+    return DBClientManager(pool_size, connect_timeout, read_timeout)
+
+def get_configured_DBclient_manager():
+    """Returns the client manager configured through the app secrets (`dbpool_size`, `dbconnect_timeout`, `dbread_timeout`)."""
+    return get_DBclient_manager(
+        int(st.secrets.get("dbpool_size", 8)),
+        float(st.secrets.get("dbconnect_timeout", 10)),
+        float(st.secrets.get("dbread_timeout", 100))
+    )
@@ -0,0 +1,170 @@
+"""
+Module Name:    Disk Cache
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the persistent, size-capped cache where the EU Justice Dashboard
+                keeps the columnar copies of its inputs, so a restarted server can serve from local data.
+This version:   October 17th, 2026
+"""
+import os
+import json
+import shutil
+import threading
+import time
+import pandas as pd
+
+# Defining a function to write a file without ever leaving a partial copy behind
+def atomic_write(path, writer):
+    """Calls `writer(tmp_path)` and moves the result into place with a single `os.replace`."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        writer(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+# Defining the cache class
+class DiskCache:
+    """Stores {name: data frame} entries as Parquet files under `folder`.
+
+    A JSON manifest records, for every entry, the files it is made of, their columns, its
+    size on disk and when it was last read, plus which entry currently holds each source
+    file. The manifest is only written when entries or sources change, so read times are
+    saved together with the next change rather than on every read. When the cache grows over
+    `max_bytes`, the least recently used entries are evicted, except for the pinned ones (the
+    copies the current data generation is read from).
+    """
+
+    def __init__(self, folder, max_bytes):
+        self.folder    = folder
+        self.max_bytes = max_bytes
+        self._lock     = threading.Lock()
+        self._pinned   = set()
+        os.makedirs(folder, exist_ok = True)
+        self._manifest = self._read_manifest()
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.folder, "manifest.json")
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault("entries", {})
+        manifest.setdefault("sources", {})
+        return manifest
+
+    def _write_manifest(self):
+        def writer(tmp_path):
+            with open(tmp_path, "w") as f:
+                json.dump(self._manifest, f)
+        atomic_write(self.manifest_path, writer)
+
+    def _entry_paths(self, key, names):
+        return {name: os.path.join(self.folder, key, f"{name}.parquet") for name in names}
+
+    def source(self, file):
+        """Returns the manifest record (`key`, `content_hash`, `rev`, ...) of a source file, if any."""
+        with self._lock:
+            return dict(self._manifest["sources"].get(file, {})) or None
+
+    @staticmethod
+    def _holds(entry, names, columns):
+        if entry is None or not set(names) <= set(entry["names"]):
+            return False
+        # entries written before their columns were recorded only match unprojected reads
+        stored = entry.get("columns")
+        for name, needed in (columns or {}).items():
+            if needed is not None and (stored is None or not set(needed) <= set(stored.get(name, []))):
+                return False
+        return True
+
+    def has(self, key, names, columns = None):
+        """Returns True if the entry stored under `key` holds every one of `names`, without reading it.
+
+        `columns` ({name: columns}) also requires those columns to be stored.
+        """
+        with self._lock:
+            if not self._holds(self._manifest["entries"].get(key), names, columns):
+                return False
+            return all(os.path.exists(path) for path in self._entry_paths(key, names).values())
+
+    def get(self, key, names = None, columns = None):
+        """Returns the {name: data frame} entry stored under `key` (only `names`, if given), or None on a miss.
+
+        `columns` ({name: columns}) only reads those columns of the Parquet files.
+        """
+        columns = columns or {}
+        with self._lock:
+            entry = self._manifest["entries"].get(key)
+            if entry is None or not self._holds(entry, entry["names"] if names is None else names, columns):
+                return None
+            paths = self._entry_paths(key, entry["names"] if names is None else names)
+            if not all(os.path.exists(path) for path in paths.values()):
+                self._drop(key)
+                self._write_manifest()
+                return None
+            # reads only touch the manifest in memory; it reaches disk with the next write
+            entry["last_access"] = time.time()
+        return {
+            name: pd.read_parquet(path, columns = None if columns.get(name) is None else list(columns[name]))
+            for name, path in paths.items()
+        }
+
+    def put(self, key, dfs):
+        """Stores a {name: data frame} entry under `key`. Returns False if it could not be written."""
+        folder = os.path.join(self.folder, key)
+        os.makedirs(folder, exist_ok = True)
+        paths = self._entry_paths(key, dfs.keys())
+        try:
+            for name, df in dfs.items():
+                atomic_write(paths[name], lambda tmp_path: df.to_parquet(tmp_path, compression = "zstd", index = False))
+        except Exception:
+            # Frames that Arrow cannot type (e.g. mixed object columns) are simply not cached
+            shutil.rmtree(folder, ignore_errors = True)
+            return False
+
+        with self._lock:
+            self._manifest["entries"][key] = {
+                "names"       : list(dfs.keys()),
+                "columns"     : {name: [str(column) for column in df.columns] for name, df in dfs.items()},
+                "size"        : sum(os.path.getsize(path) for path in paths.values()),
+                "last_access" : time.time()
+            }
+            self._evict(keep = key)
+            self._write_manifest()
+        return True
+
+    def pin(self, keys):
+        """Protects the entries stored under `keys` from eviction (replacing the previously pinned ones)."""
+        with self._lock:
+            self._pinned = set(keys)
+
+    def set_source(self, file, key, **source_info):
+        """Records the entry stored under `key` as the current copy of the source `file`."""
+        with self._lock:
+            if key in self._manifest["entries"]:
+                self._manifest["sources"][file] = {"key": key, **source_info}
+                self._write_manifest()
+
+    def _drop(self, key):
+        self._manifest["entries"].pop(key, None)
+        self._manifest["sources"] = {
+            file: info for file, info in self._manifest["sources"].items() if info["key"] != key
+        }
+        shutil.rmtree(os.path.join(self.folder, key), ignore_errors = True)
+
+    def _evict(self, keep):
+        entries = self._manifest["entries"]
+        total   = sum(entry["size"] for entry in entries.values())
+        for key in sorted(entries, key = lambda k: entries[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep or key in self._pinned:
+                continue
+            total -= entries[key]["size"]
+            self._drop(key)
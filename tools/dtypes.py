@@ -0,0 +1,145 @@
+"""
+Module Name:    Data Types
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the compact data types of the dashboard inputs: dimension columns
+                become categoricals sharing one dictionary per data generation, and float metrics are
+                downcast to float32 unless they hold whole numbers (e.g. counts) that float32 cannot
+                represent exactly.
+This version:   October 17th, 2026
+"""
+import threading
+import numpy as np
+import pandas as pd
+
+# Dimension columns of the inputs and the dictionary each one is coded with. Columns naming the
+# same thing in different files (e.g. the country) share a dictionary.
+DIMENSIONS = {
+    "country_name_ltn" : "country",
+    "country"          : "country",
+    "level"            : "level",
+    "id"               : "id",
+    "demographic"      : "demographic",
+    "category"         : "category",
+    "adviser"          : "adviser",
+    "gender"           : "gender",
+    "fintight"         : "fintight",
+}
+
+# Defining the shared category dictionaries
+class CategoryDictionary:
+    """Append-only {dimension: values} dictionaries shared by every frame of a data generation.
+
+    New values are only ever appended, so a value gets the same integer code in every frame,
+    including the sheets of lazy inputs that are converted after the rest.
+    """
+
+    def __init__(self):
+        self._lock   = threading.Lock()
+        self._values = {}
+
+    def update(self, dimension, values):
+        """Adds the unseen `values` of a dimension (sorted) at the end of its dictionary."""
+        with self._lock:
+            known = self._values.setdefault(dimension, {})
+            for value in sorted(set(pd.unique(values)) - set(known), key = str):
+                known[value] = len(known)
+
+    def copy(self):
+        """Returns a new dictionary holding the same values with the same codes."""
+        other = CategoryDictionary()
+        with self._lock:
+            other._values = {dimension: dict(values) for dimension, values in self._values.items()}
+        return other
+
+    def dtype(self, dimension):
+        """Returns the categorical dtype holding every value of a dimension seen so far."""
+        with self._lock:
+            return pd.CategoricalDtype(list(self._values.get(dimension, {})))
+
+# Defining the memory report
+class MemoryReport:
+    """Thread-safe record of the memory used by every input before and after compaction."""
+
+    def __init__(self):
+        self._lock   = threading.Lock()
+        self._tables = {}
+
+    def record(self, name, before, after):
+        with self._lock:
+            self._tables[name] = {"before": before, "after": after}
+
+    def subset(self, names):
+        """Returns a new report holding the tables of the inputs in `names` (and of their sheets)."""
+        other = MemoryReport()
+        with self._lock:
+            other._tables = {
+                name: dict(sizes) for name, sizes in self._tables.items() if name.split("/")[0] in names
+            }
+        return other
+
+    def as_dict(self):
+        """Returns the bytes used by every table before and after compaction, and the total saved."""
+        with self._lock:
+            tables = {name: dict(sizes) for name, sizes in self._tables.items()}
+        before = sum(sizes["before"] for sizes in tables.values())
+        after  = sum(sizes["after"] for sizes in tables.values())
+        return {"tables": tables, "before": before, "after": after, "saved": before - after}
+
+# Defining the conversions
+def dimension_columns(df):
+    """Returns the {column: dimension} pairs of the dimension columns of `df`."""
+    return {column: DIMENSIONS[column] for column in df.columns if column in DIMENSIONS}
+
+def register(dictionary, df):
+    """Adds the dimension values of `df` to the shared dictionary."""
+    for column, dimension in dimension_columns(df).items():
+        dictionary.update(dimension, df[column].dropna())
+
+def downcast(values):
+    """Returns a float64 column as float32, or unchanged when the conversion is not safe.
+
+    float32 keeps about 7 significant digits, which is plenty for shares and averages. Columns of
+    whole numbers (counts, which feed suppression and prevalence) are only downcast when every
+    value survives the conversion exactly, and no column is downcast if a value overflows float32.
+    """
+    original = values.to_numpy()
+    with np.errstate(over = "ignore"):
+        narrow = original.astype(np.float32)
+    if not np.array_equal(np.isfinite(narrow), np.isfinite(original)):
+        return values
+    finite = original[np.isfinite(original)]
+    if np.array_equal(finite, np.round(finite)) and not np.array_equal(narrow, original, equal_nan = True):
+        return values
+    return values.astype(np.float32)
+
+def compact(df, dictionary, report = None, name = None):
+    """Returns `df` with categorical dimensions (coded with `dictionary`) and float32 metrics.
+
+    The values of `df` must have been added to `dictionary` with `register` first.
+    """
+    before = int(df.memory_usage(deep = True).sum())
+    columns = {
+        column: df[column].astype(dictionary.dtype(dimension))
+        for column, dimension in dimension_columns(df).items()
+    }
+    columns.update({
+        column: downcast(df[column])
+        for column in df.columns if column not in columns and df[column].dtype == np.float64
+    })
+    df = df.assign(**columns)
+    if report is not None:
+        report.record(name, before, int(df.memory_usage(deep = True).sum()))
+    return df
+
+def combine(left, right, sep = ", "):
+    """Returns the categorical "<left><sep><right>" labels of two categorical columns.
+
+    The labels are built once per category pair and picked by integer code, instead of
+    concatenating strings row by row.
+    """
+    left, right = left.astype("category"), right.astype("category")
+    labels = [f"{a}{sep}{b}" for a in left.cat.categories for b in right.cat.categories]
+    codes  = left.cat.codes.to_numpy() * len(right.cat.categories) + right.cat.codes.to_numpy()
+    codes  = np.where((left.cat.codes.to_numpy() < 0) | (right.cat.codes.to_numpy() < 0), -1, codes)
+    return pd.Series(pd.Categorical.from_codes(codes, labels), index = left.index)
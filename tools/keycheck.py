@@ -0,0 +1,63 @@
+"""
+Module Name:    Key Check
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module checks that the dashboard pages never build element keys from random or
+                time-based values, which would force Streamlit to remount the element on every rerun.
+                Run it from the repository root with `python -m tools.keycheck`.
+This version:   October 17th, 2026
+"""
+import ast
+import sys
+from pathlib import Path
+
+# Calls that return a different value on every rerun
+RANDOM_CALLS = {
+    "uuid.uuid1", "uuid.uuid4", "uuid1", "uuid4",
+    "random.random", "random.randint", "random.choice", "random.getrandbits",
+    "secrets.token_hex", "secrets.token_urlsafe",
+    "time.time", "time.time_ns", "time.perf_counter", "time.monotonic",
+    "datetime.now", "datetime.datetime.now", "id",
+}
+
+# Defining a function to get the dotted name of a called function
+def call_name(node):
+    """Returns the dotted name of a call (e.g. `uuid.uuid4`), or None for other callables."""
+    parts = []
+    func  = node.func
+    while isinstance(func, ast.Attribute):
+        parts.append(func.attr)
+        func = func.value
+    if not isinstance(func, ast.Name):
+        return None
+    parts.append(func.id)
+    return ".".join(reversed(parts))
+
+# Defining a function to find the random keys of a script
+def find_random_keys(source, filename = "<page>"):
+    """Returns a (line, call) list of the `key=` arguments of `source` that call a random or time-based function."""
+    findings = []
+    for node in ast.walk(ast.parse(source, filename = filename)):
+        if not isinstance(node, ast.Call):
+            continue
+        for keyword in node.keywords:
+            if keyword.arg != "key":
+                continue
+            for inner in ast.walk(keyword.value):
+                if isinstance(inner, ast.Call) and call_name(inner) in RANDOM_CALLS:
+                    findings.append((keyword.value.lineno, call_name(inner)))
+    return findings
+
+def check_pages(folder = "."):
+    """Prints every random key found in the app scripts under `folder` and returns their number."""
+    root    = Path(folder)
+    scripts = sorted(root.glob("*.py")) + sorted(root.glob("pages/*.py"))
+    count   = 0
+    for script in scripts:
+        for line, call in find_random_keys(script.read_text(encoding = "utf-8"), str(script)):
+            print(f"{script}:{line}: element key built with {call}()")
+            count += 1
+    return count
+
+if __name__ == "__main__":
+    sys.exit(1 if check_pages(sys.argv[1] if len(sys.argv) > 1 else ".") else 0)
@@ -4,11 +4,13 @@ Author:         Carlos Alberto Toruño Paniagua
 Date:           May 20th, 2024
 Description:    This module contains all the functions and classes to be used by the EU Copilot 
                 Dashboard for visualizing GPP data.
-This version:   May 20th, 2024
+This version:   October 17th, 2026
 """
 import streamlit as st
 import requests
 import json
+import threading
+import time
 
 # Defining a function to check for password
 def check_password():
@@ -38,15 +40,74 @@ def check_password():
     else:
         # Password correct.
         return True
-    
-def retrieve_DBtoken(key, secret, refresh_token):
+
+# Defining a function to request a new access token from the Dropbox OAuth endpoint
+def request_DBtoken(key, secret, refresh_token, timeout = 10):
+    """Returns the parsed OAuth response (`access_token`, `expires_in`, ...).
+
+    Raises on HTTP errors and when the endpoint does not answer within `timeout` seconds.
+    """
     data = {
         'refresh_token': refresh_token,
         'grant_type': 'refresh_token',
         'client_id': key,
         'client_secret': secret,
     }
-    response = requests.post('https://api.dropbox.com/oauth2/token', data = data)
+    response = requests.post('https://api.dropbox.com/oauth2/token', data = data, timeout = timeout)
+    response.raise_for_status()
     response_data = json.loads(response.text)
+    return response_data
+
+def retrieve_DBtoken(key, secret, refresh_token):
+    response_data = request_DBtoken(key, secret, refresh_token)
     access_token  = response_data["access_token"]
-    return access_token
\ No newline at end of file
+    return access_token
+
+# Defining a class that keeps the Dropbox access token alive across reruns and sessions
+class DBTokenManager:
+    """Holds a Dropbox access token and refreshes it shortly before it expires.
+
+    Refreshes are single-flight: when many sessions find the token stale at the
+    same time, only the first one calls the OAuth endpoint and the others wait
+    for (and reuse) its result.
+    """
+
+    def __init__(self, key, secret, refresh_token, margin = 300):
+        self.key           = key
+        self.secret        = secret
+        self.refresh_token = refresh_token
+        self.margin        = margin         # seconds before expiry to refresh
+        self._state        = (None, 0.0)    # (access token, monotonic expiry)
+        self._lock         = threading.Lock()
+
+    def _is_fresh(self, state):
+        token, expires_at = state
+        return token is not None and time.monotonic() < expires_at - self.margin
+
+    def get(self):
+        """Returns a valid access token, refreshing it if it is about to expire."""
+        state = self._state
+        if self._is_fresh(state):
+            return state[0]
+
+        with self._lock:
+            # Another session may have refreshed the token while we were waiting
+            state = self._state
+            if self._is_fresh(state):
+                return state[0]
+            try:
+                response_data = request_DBtoken(self.key, self.secret, self.refresh_token)
+                access_token  = response_data["access_token"]
+                expires_in    = response_data.get("expires_in", 14400)
+            except Exception:
+                # Keep serving the current token if it has not actually expired yet
+                if state[0] is not None and time.monotonic() < state[1]:
+                    return state[0]
+                raise
+            self._state = (access_token, time.monotonic() + expires_in)
+            return self._state[0]
+
+@st.cache_resource(show_spinner = False)
+def get_DBtoken_manager(key, secret, refresh_token):
+    """Returns the process-wide token manager for a set of Dropbox credentials."""
+    return DBTokenManager(key, secret, refresh_token)
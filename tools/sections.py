@@ -0,0 +1,321 @@
+"""
+Module Name:    Sections
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the registry of the Justice Journey dashboard: what every section
+                shows (its data slice, metrics and chart) and how each demographic group is presented,
+                plus the renderer that draws any section for any disaggregation from that registry.
+This version:   October 17th, 2026
+"""
+import pandas as pd
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from tools import aggregates, charts
+
+# Every disaggregation offered by the dashboard: its label in chart titles and how each of its
+# demographic groups is presented. `indicator` is the demographic of a group in the GPP data points;
+# groups without one get their prevalence from the Section1 counts. The data store slices the
+# sections by these groups.
+DISAGGREGATIONS = {
+    "Total sample": {
+        "label"  : None,
+        "groups" : {
+            "Total sample"       : {"header": "{country}",          "panel": None,                 "indicator": "Total Sample", "color": None,      "link_color": None},
+        },
+    },
+    "Disagreggated by Gender": {
+        "label"  : "Gender",
+        "groups" : {
+            "Male"               : {"header": "Men in {country}",   "panel": "Men",                "indicator": "Male",         "color": "blue",    "link_color": "#87CEEB"},
+            "Female"             : {"header": "Women in {country}", "panel": "Women",              "indicator": "Female",       "color": "pink",    "link_color": "pink"},
+        },
+    },
+    "Disagreggated by Income": {
+        "label"  : "Economic Status",
+        "groups" : {
+            "Financially Tight"  : {"header": "Financially Tight",  "panel": "Financially Tight",  "indicator": None,           "color": "#B33C86", "link_color": "#CBC3E3"},
+            "Financially Stable" : {"header": "Financially Stable", "panel": "Financially Stable", "indicator": None,           "color": "#1C7C54", "link_color": "#90EE90"},
+        },
+    },
+}
+DEMOGRAPHIC_GROUPS = {option: list(spec["groups"]) for option, spec in DISAGGREGATIONS.items()}
+GROUPS             = {group: style for spec in DISAGGREGATIONS.values() for group, style in spec["groups"].items()}
+
+# Names of the advisers of Section3
+ADVISERS = {
+    'AJD_adviser_1': 'Relatives and friends',
+    'AJD_adviser_2': 'Lawyer or professional adviser',
+    'AJD_adviser_3': 'Government legal aid',
+    'AJD_adviser_4': 'Court, govt, police',
+    'AJD_adviser_5': 'Health or welfare adviser',
+    'AJD_adviser_6': 'Trade union or employer',
+    'AJD_adviser_7': 'Religious or community advisor',
+    'AJD_adviser_8': 'Civil society or charity',
+    'AJD_adviser_9': 'Other organization advisor',
+}
+
+# The dashboard sections, in display order. Every row of a section's table reads `metric` from the
+# first row of the group's slice of `sheet` (times `scale`) and shows it in `text` at the `{value}`
+# placeholder; the `prevalence` metric comes from the GPP data points. `chart` names one of the chart
+# builders below and the sheet it is drawn from.
+REGISTRY = {
+    "Section1": {
+        "title" : "1. Legal Process",
+        "rows"  : [
+            {"metric": "prevalence", "text": "{value} experienced a non-trivial legal problem in the last two years."},
+        ],
+        "chart" : {"type": "lollipop", "sheet": "Section1", "title": "Legal Process"},
+    },
+    "Section2": {
+        "title" : "2. Legal Capability",
+        "rows"  : [
+            {"sheet": "Section2", "metric": "get_information", "text": "{value} knew where to get advice and information."},
+            {"sheet": "Section2", "metric": "get_expert",      "text": "{value} felt that they could get all of the expert help they needed."},
+            {"sheet": "Section2", "metric": "confidence",      "text": "{value} were confident that they could achieve a fair outcome."},
+        ],
+    },
+    "Section3": {
+        "title" : "3. Sources of Help",
+        "rows"  : [
+            {"sheet": "Section2", "metric": "advice", "text": "{value} were able to access help for their issue."},
+        ],
+        "chart" : {"type": "sankey", "sheet": "Section3", "title": "Distribution of Advisors"},
+    },
+    "Section4": {
+        "title" : "4. Status",
+        "rows"  : [
+            {"sheet": "Section4", "metric": "fully_resolved",   "text": "{value} were able to fully resolve the issue."},
+            {"sheet": "Section4", "metric": "problem_persists", "text": "{value} gave up any action to solve the problem further."},
+            {"sheet": "Section4", "metric": "satisfaction",     "text": "{value} were satisfied with the outcome of the resolution."},
+        ],
+    },
+    "Section5": {
+        "title" : "5. Process",
+        "rows"  : [
+            {"sheet": "Section5", "metric": "fair",           "text": "{value} said that the process was fair."},
+            {"sheet": "Section5", "metric": "time",           "text": "On average, it took {value} months to solve the problem.", "scale": 1, "format": "{:.1f}"},
+            {"sheet": "Section5", "metric": "financial_diff", "text": "{value} said that it was difficult or nearly impossible to find the money required to solve the problem."},
+            {"sheet": "Section5", "metric": "slow",           "text": "{value} said that the process was slow."},
+            {"sheet": "Section5", "metric": "expensive",      "text": "{value} said that the process was expensive."},
+        ],
+    },
+    "Section6": {
+        "title" : "6. Hardship",
+        "rows"  : [],
+        "chart" : {
+            "type"    : "bars",
+            "sheet"   : "Section6",
+            "title"   : " ",
+            "metrics" : ["any_hardship", "health", "interpersonal", "economic", "drugs"],
+        },
+    },
+}
+
+# Columns of every sheet of the workbook that the registry does not name itself: the column the sheet
+# is broken down by (if any), the count its small-cell suppression is based on, and the metrics the
+# charts and the prevalence are computed from. The metrics of the table rows and charts above are
+# added to them, so the data store loads, suppresses and averages every column the registry reads.
+SHEETS = {
+    "Section1" : {"by": "category", "count": "total_count",   "metrics": ["value2plot", "total_incidents"]},
+    "Section2" : {"by": None,       "count": "count",         "metrics": []},
+    "Section3" : {"by": "adviser",  "count": "total_sources", "metrics": ["value2plot"]},
+    "Section4" : {"by": None,       "count": "count",         "metrics": []},
+    "Section5" : {"by": None,       "count": "count",         "metrics": []},
+    "Section6" : {"by": None,       "count": "count",         "metrics": []},
+}
+
+def sheet_metrics(sheet):
+    """Returns every metric of a sheet: its count, its own metrics and those read by the registry."""
+    metrics = [SHEETS[sheet]["count"], *SHEETS[sheet]["metrics"]]
+    for spec in REGISTRY.values():
+        metrics += [row["metric"] for row in spec["rows"] if row.get("sheet") == sheet]
+        chart    = spec.get("chart")
+        if chart is not None and chart["sheet"] == sheet:
+            metrics += chart.get("metrics", [])
+    return list(dict.fromkeys(metrics))
+
+def sheet_columns(sheet):
+    """Returns the {column: dtype} declaration of a sheet: its keys, breakdown column and metrics."""
+    keys = ["country_name_ltn", "demographic"] + ([SHEETS[sheet]["by"]] if SHEETS[sheet]["by"] else [])
+    return {**dict.fromkeys(keys, "str"), **dict.fromkeys(sheet_metrics(sheet), "float64")}
+
+SECTION_COLUMNS = {sheet: sheet_columns(sheet) for sheet in SHEETS}
+
+# Defining the context every section is rendered in
+class View:
+    """The slice of the dashboard selected by the user: a country and a disaggregation."""
+
+    def __init__(self, snapshot, country, level, demographic):
+        self.snapshot    = snapshot
+        self.country     = country
+        self.level       = level            # `national` or `eu` (GPP data points)
+        self.demographic = demographic      # an option of DISAGGREGATIONS
+        self.groups      = DEMOGRAPHIC_GROUPS[demographic]
+
+    def slice(self, sheet, group):
+        """Returns the rows of `sheet` for one group of the selected country."""
+        return aggregates.get_section(self.snapshot.get("section_cube"), group, sheet, self.country)
+
+    def prevalence(self, group):
+        """Returns the share of the group that experienced a non-trivial legal problem."""
+        indicator = GROUPS[group]["indicator"]
+        if indicator is not None:
+            return self.snapshot.get("indicator_index").get((self.country, self.level, 'prevalence2', indicator), float("nan"))
+        counts = self.slice("Section1", group)
+        return counts['total_count'].sum() / counts['total_incidents'].mean()
+
+# Defining the functions drawing the tables
+def format_value(view, row, group):
+    """Returns the value of a table row for one group, formatted for display."""
+    if row["metric"] == "prevalence":
+        value = view.prevalence(group)
+    else:
+        frame = view.slice(row["sheet"], group)
+        value = frame[row["metric"]].iloc[0] if len(frame) else float("nan")
+    if pd.isna(value):
+        return "n/a"
+    return row.get("format", "{:.2f}%").format(value * row.get("scale", 100))
+
+def section_table(view, spec):
+    """Returns the HTML title and table of a section, with one column per demographic group."""
+    cell   = 'style="border: 1px solid #ddd; padding: 8px; color:#003249;"'
+    header = "".join(
+        f'<th style="border: 1px solid #ddd; padding: 8px;">{GROUPS[group]["header"].format(country = view.country)}</th>'
+        for group in view.groups
+    )
+    rows = "".join(
+        "<tr>" + "".join(
+            f'<td {cell}>{row["text"].format(value = f"<strong>{format_value(view, row, group)}</strong>")}</td>'
+            for group in view.groups
+        ) + "</tr>"
+        for row in spec["rows"]
+    )
+    table = ""
+    if rows:
+        table = f"""
+            <table style="width:100%; text-align:center; border-collapse: collapse; border: 1px solid #ddd;">
+                <thead><tr style="background-color: #f2f2f2;">{header}</tr></thead>
+                <tbody>{rows}</tbody>
+            </table>
+        """
+    return f"<h3 style='text-align: center;'>{spec['title']}</h3>{table}"
+
+# Defining the chart builders. Each one draws a panel per demographic group.
+def chart_title(spec, label):
+    """Returns the chart title, naming the disaggregation when there is one (blank titles stay blank)."""
+    if label is None or not spec["title"].strip():
+        return spec["title"]
+    return f"{spec['title']} by {label}"
+
+def panel_titles(groups):
+    titles = [GROUPS[group]["panel"] for group in groups]
+    return titles if any(titles) else None
+
+def build_lollipop(frames, spec, label):
+    """Problem prevalence by category: one lollipop panel per group."""
+    groups = [group for group, _ in frames]
+    fig    = make_subplots(rows = 1, cols = len(frames), subplot_titles = panel_titles(groups), shared_yaxes = True)
+    for col, (group, df) in enumerate(frames, 1):
+        color = GROUPS[group]["color"] or charts.category_colors(df['category'])
+        charts.add_lollipops(fig, df, x = 'value2plot', y = 'category', color = color, name = group, row = 1, col = col)
+
+    fig.update_traces(hovertemplate = 'Category: %{y} <br> Value: %{x:.2f}%')
+    fig.update_xaxes(title_text = "Percentage of Respondents", range = (0,100))
+    fig.update_yaxes(title_text = "Type of Problem", row = 1, col = 1)
+    fig.update_layout(title = chart_title(spec, label), template = "plotly_white", showlegend = False)
+    if len(frames) > 1:
+        fig.update_layout(height = 600, width = 800)
+    return fig
+
+def build_sankey(frames, spec, label):
+    """Sources of help: one Sankey panel per group, flowing from every adviser into the total."""
+    groups = [group for group, _ in frames]
+    fig    = make_subplots(
+        rows = 1, cols = len(frames), subplot_titles = panel_titles(groups),
+        specs = [[{"type": "sankey"}] * len(frames)]
+    )
+    for col, (group, df) in enumerate(frames, 1):
+        names = df['adviser'].map(ADVISERS)
+        link  = dict(
+            source = list(range(len(df))),
+            target = [len(df)] * len(df),
+            value = (df["value2plot"]*100).tolist(),
+            customdata = names,
+            hovertemplate = 'Advisor: %{customdata}<br>Value: %{value:.2f}%<extra></extra>'
+        )
+        if GROUPS[group]["link_color"] is not None:
+            link["color"] = [GROUPS[group]["link_color"]] * len(df)
+        fig.add_trace(
+            go.Sankey(
+                node = dict(pad = 15, thickness = 20, line = dict(color = "black", width = 0.5), label = names.tolist() + ["Total"]),
+                link = link
+            ),
+            row = 1, col = col
+        )
+
+    fig.update_layout(title_text = chart_title(spec, label), font_size = 12, template = "plotly_white")
+    if len(frames) > 1:
+        fig.update_layout(height = 500)
+    return fig
+
+def build_bars(frames, spec, label):
+    """Hardship: one bar per metric, one panel per group."""
+    groups = [group for group, _ in frames]
+    fig    = make_subplots(rows = 1, cols = len(frames), subplot_titles = panel_titles(groups), shared_yaxes = True)
+    for col, (group, df) in enumerate(frames, 1):
+        values = df[spec["metrics"]].iloc[0] if len(df) else pd.Series(float("nan"), index = spec["metrics"])
+        fig.add_trace(
+            go.Bar(
+                x = spec["metrics"],
+                y = values * 100,
+                marker_color = px.colors.qualitative.Plotly,
+                showlegend = False,
+                name = group
+            ),
+            row = 1, col = col
+        )
+
+    fig.update_traces(hovertemplate = '%{y:.2f}%')
+    fig.update_xaxes(title_text = "Type of Hardship")
+    fig.update_yaxes(title_text = "Proportion of Respondents (%)", row = 1, col = 1)
+    fig.update_layout(
+        title = chart_title(spec, label),
+        template = "plotly_white",
+        font = dict(size = 14),
+        showlegend = False,
+        yaxis = dict(range = (0,100))
+    )
+    return fig
+
+CHART_BUILDERS = {
+    "lollipop" : build_lollipop,
+    "sankey"   : build_sankey,
+    "bars"     : build_bars,
+}
+
+# Defining the renderer
+def render_section(view, section):
+    """Draws the title, table and chart of a registered section for the selected view."""
+    spec = REGISTRY[section]
+    st.markdown(section_table(view, spec), unsafe_allow_html = True)
+
+    chart = spec.get("chart")
+    if chart is not None:
+        def build():
+            frames = [(group, view.slice(chart["sheet"], group)) for group in view.groups]
+            return CHART_BUILDERS[chart["type"]](frames, chart, DISAGGREGATIONS[view.demographic]["label"])
+
+        # figures only depend on the view and the data generation, so every session shares them
+        key = ("A2J_Dashboard", section, view.country, view.demographic)
+        st.plotly_chart(charts.cached_figure(key, view.snapshot.version, build))
+
+def render_arrow():
+    """Draws the arrow leading from one section to the next."""
+    st.markdown(
+        """
+        <div style="font-size: 40px; color: #003249; text-align: center">&#x2193;</div> <!-- Downward arrow -->
+        """,
+        unsafe_allow_html = True
+    )
@@ -0,0 +1,37 @@
+"""
+Module Name:    Suppression
+Author:         Isabella Coddington
+Date:           October 17th, 2026
+Description:    This module contains the small-cell suppression applied to the dashboard inputs: values
+                based on too few observations are blanked once per data generation, before any page
+                slices, aggregates or plots them.
+This version:   October 17th, 2026
+"""
+import numpy as np
+
+# Smallest number of observations a published value may be based on
+MIN_OBSERVATIONS = 30
+
+# Defining the suppression rule
+def rule(count, threshold = MIN_OBSERVATIONS, columns = None):
+    """Returns a suppression rule: blank `columns` (every column by default) wherever `count` < `threshold`.
+
+    Blanking every column drops the row from the slices, like the filters it replaces.
+    """
+    return {"count": count, "threshold": threshold, "columns": columns}
+
+# Defining the suppression engine
+def suppress(df, rule):
+    """Returns `df` with the cells selected by `rule` blanked, in a single vectorized mask (or `df` itself)."""
+    if rule is None:
+        return df
+    small = (df[rule["count"]] < rule["threshold"]).to_numpy()
+    if not small.any():
+        return df
+    columns = df.columns if rule["columns"] is None else rule["columns"]
+    blank   = np.outer(small, df.columns.isin(columns))
+    return df.mask(blank)
+
+def suppress_sheets(rules):
+    """Returns the `transform(sheet, df)` applying the {sheet: rule} rules of a workbook (see LazyMapping.map)."""
+    return lambda sheet, df: suppress(df, rules.get(sheet))